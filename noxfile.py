@@ -46,6 +46,12 @@ def tests(session):
         "-m",
         "not e2e and not con and not slow",
         # append exlcuded markers as "and not ..."
+        # (replaces the "not integration" default, so the db tests run here)
+        # keep test files on one worker, so test dependencies resolve
+        "-n",
+        "auto",
+        "--dist",
+        "loadfile",
     ]
     session.run("poetry", "install", "--no-dev", external=True)
     install_with_constraints(
@@ -55,6 +61,8 @@ def tests(session):
         "pytest-cov",
         "pytest-mock",
         "pytest_dependency",
+        "pytest-xdist",
+        "filelock",
         "ccm",
     )
     session.run("pytest", *args)
@@ -1,15 +1,32 @@
 # src/fogd_db/casdriv.py
 """Cassandra-Driver CRUD interface."""
-from collections import abc, namedtuple
+import weakref
+from collections import namedtuple
+from functools import lru_cache
 
 import cassandra.cluster
 import cassandra.cqlengine.management as cql_manage
+from cassandra.concurrent import execute_concurrent, execute_concurrent_with_args
 from cassandra.cqlengine import connection
+from cassandra.metadata import protect_name
+
+from cassy import cql
+
+#: Tuple of cluster and session as returned by :func:`connect_session`.
+CnS = namedtuple("CnS", ["cluster", "session"])
+
+# (ips, port, cluster kwargs) -> session
+_SESSIONS = weakref.WeakValueDictionary()
 
 
 def connect_session(ips=("127.0.0.1",), port=9042, **kwargs):
     """Connect and return session using :mod:`fogd_db.casdb`.
 
+    Sessions are reused: Calling again with the same arguments returns the
+    existing cluster and session, as long as the session is still referenced
+    elsewhere and was not shut down. Dictionairy arguments, like
+    ``execution_profiles``, are compared by their items.
+
     Parameters
     ----------
     ips: ~collections.abc.Container
@@ -35,18 +52,36 @@ def connect_session(ips=("127.0.0.1",), port=9042, **kwargs):
         <https://docs.datastax.com/en/developer/python-driver/3.18/api/cassandra/cluster/#cassandra.cluster.Session>`_
         as in ``('cluster'=cluster, 'session'=session)``.
     """
+    try:
+        options = frozenset(
+            (name, frozenset(value.items()) if isinstance(value, dict) else value)
+            for name, value in kwargs.items()
+        )
+        key = (tuple(ips), port, options)
+        session = _SESSIONS.get(key)
+    except TypeError:  # pragma: no cover
+        # unhashable cluster options, so do not cache
+        session = _connect(ips, port, kwargs)
+        return CnS(session.cluster, session)
+
+    if session is None or session.is_shutdown:
+        session = _connect(ips, port, kwargs)
+        _SESSIONS[key] = session
+
+    return CnS(session.cluster, session)
+
+
+def _connect(ips, port, kwargs):
     # create cluster object
     cluster = cassandra.cluster.Cluster(contact_points=ips, port=port, **kwargs)
 
     # and connect non keyspace session
     session = cluster.connect()
 
-    # infer cluster name
-    cluster_name = get_cluster_name(cluster)
+    # register connection using the cluster name known from metadata
+    connection.register_connection(cluster.metadata.cluster_name, session=session)
 
-    # register connection using the inferred cluster name
-    connection.register_connection(cluster_name, session=session)
-    return namedtuple("CnS", ["cluster", "session"])(cluster, session)
+    return session
 
 
 def create_simple_keyspace(
@@ -108,18 +143,78 @@ def create_entry(model, data, prior_syncing=False, keyspace=None, con=None):
         Instance of the :paramref:`~create_entry.model` created using
         :paramref:`~create_entry.data`.
     """
-    if keyspace:
-        model.__keyspace__ = keyspace
-    if con:
-        model.__connection__ = con
+    if prior_syncing:
+        synchronize_model(model, keyspace, con)
+
+    return _queryset(model, keyspace, con).create(**data)
+
+
+# same arguments as create_entry, plus the concurrency limit
+# pylint: disable-next=too-many-arguments
+def create_entries(
+    model, data, prior_syncing=False, keyspace=None, con=None, concurrency=100
+):
+    """Create multiple new entries concurrently using a python data class model.
+
+    Inserts are issued as prepared statements using the cassandra
+    python-driver's `execute_concurrent
+    <https://docs.datastax.com/en/developer/python-driver/3.25/api/cassandra/concurrent/>`_
+    instead of one blocking round trip per entry.
+
+    Parameters
+    ----------
+    model
+        One of the cassandra python-driver `data class models
+        <https://docs.datastax.com/en/developer/python-driver/3.25/api/cassandra/cqlengine/models/>`_.
+    data: ~collections.abc.Iterable
+        Iterable of dictionairies, each holding the keyword value pairings of
+        an entry to be added. Must conform to the
+        :paramref:`~create_entries.model` used.
+    prior_syncing: bool, default=False
+        If ``True`` :func:`synchronize_model` is called before creation,
+        to synchronize database table and model.
+    keyspace: str, None, default=None
+        String to specify the keyspace the table is created. If ``None``,
+        ``model.__keyspace__`` is used.
+    con: str, None, default=None
+        String to specify the connection name  the table is created with.
+        :mod:`casdriv` uses :attr:`cluster name <get_cluster_name>` as
+        default connection name.
 
+        If ``None``, ``model.__connection__`` is used.
+    concurrency: int, default=100
+        Maximum number of inserts in flight at the same time.
+
+    Returns
+    -------
+    list
+        List of ``(success, result_or_exc)`` tuples, one per entry of
+        :paramref:`~create_entries.data` in the same order.
+    """
     if prior_syncing:
-        synchronize_model(model)
+        synchronize_model(model, keyspace, con)
+
+    session = connection.get_session(connection=con or model.__connection__)
+
+    # one prepared statement per session and distinct set of columns provided
+    # pylint: disable=protected-access
+    statements_and_params = [
+        (
+            cql._prepare(session, _insert_query(model, keyspace, con, *entry)),
+            _db_values(model, entry),
+        )
+        for entry in data
+    ]
 
-    return model.create(**data)
+    return execute_concurrent(
+        session,
+        statements_and_params,
+        concurrency=concurrency,
+        raise_on_first_error=False,
+    )
 
 
-def delete_entry(model, primary_keys, values, keyspace=None, con=None):
+def delete_entry(model, primary_keys, values=None, keyspace=None, con=None):
     """Delete an existing entry using a python data class model.
 
     Parameters
@@ -127,12 +222,14 @@ def delete_entry(model, primary_keys, values, keyspace=None, con=None):
     model
         One of the cassandra python-driver `data class models
         <https://docs.datastax.com/en/developer/python-driver/3.25/api/cassandra/cqlengine/models/>`_.
-    primary_keys: str, tuple
+    primary_keys: str, tuple, dict
         String or tuple of strings specifying the label/schema of the primary
-        key(s) to be read.
-    values: str, tuple
+        key(s) to be read. Alternatively a dictionairy mapping primary key
+        label(s) to the value(s) queried for.
+    values: str, tuple, None, default=None
         String or tuple of strings specifying the value of the primary key to
-        be queried for.
+        be queried for. Ignored if :paramref:`~delete_entry.primary_keys` is
+        a dictionairy.
     keyspace: str, None, default=None
         String to specify the keyspace the table is created. If ``None``,
         ``model.__keyspace__`` is used.
@@ -144,10 +241,75 @@ def delete_entry(model, primary_keys, values, keyspace=None, con=None):
         If ``None``, ``model.__connection__`` is used.
     """
     entry = read_entry(model, primary_keys, values, keyspace, con)
-    entry.delete()
+    entry.using(connection=con).delete()
+
+
+# same arguments as delete_entry, plus the concurrency limit
+# pylint: disable-next=too-many-arguments
+def delete_entries(
+    model, primary_keys, values, keyspace=None, con=None, concurrency=100
+):
+    """Delete multiple entries concurrently using a python data class model.
 
+    Unlike :func:`delete_entry` the entries are not read prior to deletion.
+    Deletes are issued as one prepared statement executed using the
+    cassandra python-driver's `execute_concurrent_with_args
+    <https://docs.datastax.com/en/developer/python-driver/3.25/api/cassandra/concurrent/>`_.
+    Deleting entries that do not exist is not an error.
 
-def get_all_entries(model, keyspace=None, con=None):
+    Parameters
+    ----------
+    model
+        One of the cassandra python-driver `data class models
+        <https://docs.datastax.com/en/developer/python-driver/3.25/api/cassandra/cqlengine/models/>`_.
+    primary_keys: str, tuple
+        String or tuple of strings specifying the label/schema of the primary
+        key(s) identifying the entries.
+    values: ~collections.abc.Iterable
+        Iterable of primary key values (or tuples of values in case
+        :paramref:`~delete_entries.primary_keys` is a tuple) of the entries
+        to be deleted.
+    keyspace: str, None, default=None
+        String to specify the keyspace the table is created. If ``None``,
+        ``model.__keyspace__`` is used.
+    con: str, None, default=None
+        String to specify the connection name  the table is created with.
+        :mod:`casdriv` uses :attr:`cluster name <get_cluster_name>` as
+        default connection name.
+
+        If ``None``, ``model.__connection__`` is used.
+    concurrency: int, default=100
+        Maximum number of deletes in flight at the same time.
+
+    Returns
+    -------
+    list
+        List of ``(success, result_or_exc)`` tuples, one per entry of
+        :paramref:`~delete_entries.values` in the same order.
+    """
+    if isinstance(primary_keys, str):
+        primary_keys = (primary_keys,)
+        values = [(value,) for value in values]
+
+    session = connection.get_session(connection=con or model.__connection__)
+    # pylint: disable=protected-access
+    delete = cql._prepare(session, _delete_query(model, keyspace, con, *primary_keys))
+    key_columns = [model._columns[name] for name in primary_keys]
+    parameters = [
+        [column.to_database(value) for column, value in zip(key_columns, entry)]
+        for entry in values
+    ]
+
+    return execute_concurrent_with_args(
+        session,
+        delete,
+        parameters,
+        concurrency=concurrency,
+        raise_on_first_error=False,
+    )
+
+
+def get_all_entries(model, keyspace=None, con=None, as_iter=False):
     """Get all entries of an existing data class model table.
 
     Uses the `cassandra python-driver queries
@@ -167,19 +329,22 @@ def get_all_entries(model, keyspace=None, con=None):
         default connection name.
 
         If ``None``, ``model.__connection__`` is used.
+    as_iter: bool, default=False
+        If ``True`` an iterator is returned instead of a list. Result pages
+        are then only fetched from the database while iterating, instead of
+        all at once before returning.
 
     Returns
     -------
-    list
-        List of table entries created via a cassandra python-driver
-        `data class models
+    list, ~collections.abc.Iterator
+        List (or iterator, see :paramref:`~get_all_entries.as_iter`) of table
+        entries created via a cassandra python-driver `data class models
         <https://docs.datastax.com/en/developer/python-driver/3.25/api/cassandra/cqlengine/models/>`_.
     """
-    if keyspace:
-        model.__keyspace__ = keyspace
-    if con:
-        model.__connection__ = con
-    return list(model.objects().all())
+    entries = _queryset(model, keyspace, con).all()
+    if as_iter:
+        return iter(entries)
+    return list(entries)
 
 
 def get_cluster_name(cluster):
@@ -215,13 +380,12 @@ def list_keyspace_tables(cluster, keyspace):
 
     Returns
     -------
-    list
-        List of strings specifying the tables currently present inside the
+    ~collections.abc.KeysView
+        View of strings specifying the tables currently present inside the
         :paramref:`~list_keyspace_tables.keyspace` of
         :paramref:`~list_keyspace_tables.cluster`.
     """
-    tables = cluster.metadata.keyspaces[keyspace].tables
-    return list(tables.keys())
+    return cluster.metadata.keyspaces[keyspace].tables.keys()
 
 
 def list_cluster_keyspaces(cluster):
@@ -236,12 +400,11 @@ def list_cluster_keyspaces(cluster):
 
     Returns
     -------
-    list
-        List of strings specifying the keyspaces currently present inside the
+    ~collections.abc.KeysView
+        View of strings specifying the keyspaces currently present inside the
         :paramref:`~list_cluster_keyspaces.cluster`.
     """
-    keyspaces = cluster.metadata.keyspaces
-    return list(keyspaces.keys())
+    return cluster.metadata.keyspaces.keys()
 
 
 def list_table_primary_keys(cluster, keyspace, table):
@@ -296,30 +459,34 @@ def list_table_columns(cluster, keyspace, table):
 
     Returns
     -------
-    list
-        List of strings specifying the found column lables
+    ~collections.abc.KeysView
+        View of strings specifying the found column lables
     """
-    columns = cluster.metadata.keyspaces[keyspace].tables[table].columns.keys()
-    return columns
+    return cluster.metadata.keyspaces[keyspace].tables[table].columns.keys()
 
 
-def read_entry(model, primary_keys, values, keyspace=None, con=None):
+def read_entry(model, primary_keys, values=None, keyspace=None, con=None):
     """Read existing entry using a python data class model.
 
-    Uses the `cassandra python-driver queries
+    Behaves like the `cassandra python-driver queries
     <https://docs.datastax.com/en/developer/python-driver/3.25/cqlengine/queryset/#retrieving-objects-with-filters>`_
+    ``get`` method. The query is issued as a prepared statement though,
+    prepared once per session and set of queried keys, so it can be routed
+    token aware.
 
     Parameters
     ----------
     model
         One of the cassandra python-driver `data class models
         <https://docs.datastax.com/en/developer/python-driver/3.25/api/cassandra/cqlengine/models/>`_.
-    primary_keys: str, tuple
+    primary_keys: str, tuple, dict
         String or tuple of strings specifying the label/schema of the primary
-        key(s) to be read.
-    values: str, tuple
+        key(s) to be read. Alternatively a dictionairy mapping primary key
+        label(s) to the value(s) queried for.
+    values: str, tuple, None, default=None
         String or tuple of strings specifying the value of the primary key to
-        be queried for.
+        be queried for. Ignored if :paramref:`~read_entry.primary_keys` is a
+        dictionairy.
     keyspace: str, None, default=None
         String to specify the keyspace the table is created. If ``None``,
         ``model.__keyspace__`` is used.
@@ -339,29 +506,50 @@ def read_entry(model, primary_keys, values, keyspace=None, con=None):
     ------
     ValueError
         Raised when :paramref:`~read_entry.primary_keys` is neither of type
-        tuple or str.
+        dict, tuple or str, when :paramref:`~read_entry.values` is missing or
+        when their lengths differ.
+    DoesNotExist
+        The :paramref:`~read_entry.model`'s ``DoesNotExist``, raised when no
+        entry matches.
+    MultipleObjectsReturned
+        The :paramref:`~read_entry.model`'s ``MultipleObjectsReturned``,
+        raised when more than one entry matches.
     """
-    # parse keyspace and connection
-    if keyspace:
-        model.__keyspace__ = keyspace
-    if con:
-        model.__connection__ = con
-
     # parse key and value pairings
-    if isinstance(primary_keys, str):
+    if isinstance(primary_keys, dict):
+        filter_dict = primary_keys
+    elif not isinstance(primary_keys, (str, tuple, list)):
+        msg1 = "'primary_keys' argument must be of type str or tuple, "
+        msg2 = f"not {type(primary_keys)}"
+        raise ValueError(msg1 + msg2)
+    elif values is None:
+        raise ValueError(
+            "'values' argument is required, unless 'primary_keys' is a dict"
+        )
+    elif isinstance(primary_keys, str):
         filter_dict = {primary_keys: values}
-    elif isinstance(primary_keys, abc.Container):
-        filter_dict = dict(zip(primary_keys, values))
-    else:
-        msg1 = "'primary_keys' argument must be of type str or tuple"
-        msg2 = "not {type(primary_keys)}"
+    elif not isinstance(values, (tuple, list)) or len(values) != len(primary_keys):
+        msg1 = "'values' argument must be a tuple holding one value per "
+        msg2 = f"primary key, {len(primary_keys)} in total, not {values!r}"
         raise ValueError(msg1 + msg2)
+    else:
+        filter_dict = dict(zip(primary_keys, values))
+
+    model_used = _queryset(model, keyspace, con).model
+    session = connection.get_session(connection=con or model.__connection__)
+    # pylint: disable=protected-access
+    select = cql._prepare(session, _select_query(model, keyspace, con, *filter_dict))
 
-    entry = model.get(**filter_dict)
-    return entry
+    rows = list(session.execute(select, _db_values(model, filter_dict)))
+    if not rows:
+        raise model_used.DoesNotExist
+    if len(rows) > 1:
+        raise model_used.MultipleObjectsReturned("Multiple objects found")
 
+    return model_used._construct_instance(rows[0])
 
-def synchronize_model(model):
+
+def synchronize_model(model, keyspace=None, con=None):
     """Synchronize the cassandra table with a python data class model.
 
     Effectively creating a cassandra table out of a data class model,
@@ -373,5 +561,76 @@ def synchronize_model(model):
         One of the cassandra python-driver `data class models
         <https://docs.datastax.com/en/developer/python-driver/3.25/api/cassandra/cqlengine/models/>`_.
         Python data class model to synch.
+    keyspace: str, None, default=None
+        String to specify the keyspace the table is synchronized in. If
+        ``None``, ``model.__keyspace__`` is used.
+    con: str, None, default=None
+        String to specify the connection name the table is synchronized with.
+        If ``None``, ``model.__connection__`` is used.
     """
-    cql_manage.sync_table(model)
+    cql_manage.sync_table(
+        model,
+        keyspaces=[keyspace] if keyspace else None,
+        connections=[con] if con else None,
+    )
+
+
+# cqlengine compares entries by class and clones the model class for every
+# keyspace bound query set, so query sets are cached to share the clones
+@lru_cache(maxsize=128)
+def _queryset(model, keyspace, con):
+    return model.objects.using(keyspace=keyspace, connection=con)
+
+
+def _select_query(model, keyspace, con, *names):
+    # the table name follows model.__keyspace__ without keyspace, so it is
+    # looked up per call and only the column clauses are cached
+    table = _queryset(model, keyspace, con).column_family_name
+    fields, where = _select_clauses(model, names)
+    # column names are white-listed by the model, so ignore S608
+    return f"SELECT {fields} FROM {table} WHERE {where} LIMIT 2"  # noqa: S608
+
+
+@lru_cache(maxsize=128)
+def _select_clauses(model, names):
+    # pylint: disable=protected-access
+    fields = ", ".join(_db_fields(model, model._columns))
+    return fields, _where_clause(model, names)
+
+
+def _delete_query(model, keyspace, con, *names):
+    # looked up per call, like in _select_query
+    table = _queryset(model, keyspace, con).column_family_name
+    # column names are white-listed by the model, so ignore S608
+    return f"DELETE FROM {table} WHERE {_where_clause(model, names)}"  # noqa: S608
+
+
+@lru_cache(maxsize=128)
+def _where_clause(model, names):
+    return " AND ".join(f"{field} = ?" for field in _db_fields(model, names))
+
+
+def _insert_query(model, keyspace, con, *names):
+    # looked up per call, like in _select_query
+    table = _queryset(model, keyspace, con).column_family_name
+    fields, markers = _insert_clauses(model, names)
+    # column names are white-listed by the model, so ignore S608
+    return f"INSERT INTO {table} ({fields}) VALUES ({markers})"  # noqa: S608
+
+
+@lru_cache(maxsize=128)
+def _insert_clauses(model, names):
+    fields = ", ".join(_db_fields(model, names))
+    markers = ", ".join("?" * len(names))
+    return fields, markers
+
+
+def _db_fields(model, names):
+    # pylint: disable=protected-access
+    return [protect_name(model._columns[name].db_field_name) for name in names]
+
+
+def _db_values(model, entry):
+    # pylint: disable=protected-access
+    columns = model._columns
+    return [columns[name].to_database(value) for name, value in entry.items()]
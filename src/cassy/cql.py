@@ -1,11 +1,41 @@
 # src/fogd_db/cql.py
 """Cassandra Query Language interface."""
-from .casdriv import (
-    list_cluster_keyspaces,
-    list_keyspace_tables,
-    list_table_columns,
-    list_table_primary_keys,
-)
+import weakref
+
+from cassandra.metadata import protect_name
+
+# session -> {query: prepared statement}
+_PREPARED = weakref.WeakKeyDictionary()
+
+# session -> cluster name
+_CLUSTER_NAMES = weakref.WeakKeyDictionary()
+
+
+def _prepare(session, query):
+    """Prepare query once per session and return the cached statement."""
+    session_cache = _PREPARED.setdefault(session, {})
+    if query not in session_cache:
+        session_cache[query] = session.prepare(query)
+    return session_cache[query]
+
+
+def _sanitize(cluster, keyspace, table, column=None, primary_key=None):
+    """Return an error message for identifiers not in the schema, else None."""
+    # descend the (local) cluster metadata once
+    keyspace_meta = cluster.metadata.keyspaces.get(keyspace)
+    if keyspace_meta is None:
+        return f"Unknown keyspace: '{keyspace}'"
+    table_meta = keyspace_meta.tables.get(table)
+    if table_meta is None:
+        return f"Unknown table: '{table}'"
+    if column is not None and column not in table_meta.columns:
+        return f"Unknown column: '{column}'"
+    if primary_key is not None and primary_key not in {
+        key.name for key in table_meta.primary_key
+    }:
+        return f"Unknown primary key: '{primary_key}'"
+
+    return None
 
 
 def create_keyspace(keyspace, session, replication="simple"):
@@ -22,6 +52,11 @@ def create_keyspace(keyspace, session, replication="simple"):
 def get_cluster_name(session):
     """Querry session for current cluster name.
 
+    Costs a round trip to the cluster on the first call per session, the
+    result is cached afterwards. Whenever the cluster object is at hand,
+    prefer :func:`cassy.casdriv.get_cluster_name`, which reads the name from
+    the cluster metadata without querying.
+
     Parameters
     ----------
     session: cassandra.cluster.Session
@@ -34,13 +69,13 @@ def get_cluster_name(session):
     str:
         Name of the cassandra cluster, the current session is connected to.
     """
-    # infer cluster name
-    query = "SELECT cluster_name FROM system.local"
-    prepped_query = session.prepare(query)
-    rows = session.execute(prepped_query)
-    cluster_name = rows.one()["cluster_name"]
+    # infer cluster name once, since it can not change for a live session
+    if session not in _CLUSTER_NAMES:
+        query = _prepare(session, "SELECT cluster_name FROM system.local")
+        rows = session.execute(query)
+        _CLUSTER_NAMES[session] = rows.one()["cluster_name"]
 
-    return cluster_name
+    return _CLUSTER_NAMES[session]
 
 
 def list_column_values(cluster, session, keyspace, table, column):
@@ -81,15 +116,11 @@ def list_column_values(cluster, session, keyspace, table, column):
         :paramref:`~list_column_values.column` are unsuccesfully
         white-listed.
     """
-    # create white_lists so sanitize tables and keyspaces:
-    if keyspace not in list_cluster_keyspaces(cluster):
-        raise KeyError(f"Unknown keyspace: '{keyspace}'")
-    if table not in list_keyspace_tables(cluster, keyspace):
-        raise KeyError(f"Unknown table: '{table}'")
-    if column not in list_table_columns(cluster, keyspace, table):
-        raise KeyError(f"Unknown column: '{column}'")
-
-    query = f"SELECT {column} FROM {keyspace}.{table}"
+    error = _sanitize(cluster, keyspace, table, column=column)
+    if error is not None:
+        raise KeyError(error)
+
+    query = _prepare(session, f"SELECT {column} FROM {keyspace}.{table}")
     rows = session.execute(query)
     return [result[column] for result in rows]
 
@@ -124,14 +155,12 @@ def get_all_entries(cluster, session, keyspace, table):
         Key Error raised if :paramref:`~get_all_entries.keyspace` or
         :paramref:`~get_all_entries.table` are unsuccesfully white-listed.
     """
-    # create white_lists so sanitize tables and keyspaces:
-    if keyspace not in list_cluster_keyspaces(cluster):
-        raise KeyError(f"Unknown keyspace: '{keyspace}'")
-    if table not in list_keyspace_tables(cluster, keyspace):
-        raise KeyError(f"Unknown table: '{table}'")
+    error = _sanitize(cluster, keyspace, table)
+    if error is not None:
+        raise KeyError(error)
 
     # keyspace and talbe sanitized, so ignore S608
-    query = f"SELECT * FROM {keyspace}.{table}"  # noqa: S608
+    query = _prepare(session, f"SELECT * FROM {keyspace}.{table}")  # noqa: S608
     rows = session.execute(query)
     return [*rows]
 
@@ -180,26 +209,106 @@ def drop_row(cns, keyspace, table, primary_key, value):
             value="Prunus domestica",
         )
     """
-    # create white_lists so sanitize tables and keyspaces:
-    if keyspace not in list_cluster_keyspaces(cns.cluster):
-        raise KeyError(f"Unknown keyspace: '{keyspace}'")
-    if table not in list_keyspace_tables(cns.cluster, keyspace):
-        raise KeyError(f"Unknown table: '{table}'")
-    if primary_key not in list_table_primary_keys(cns.cluster, keyspace, table):
-        raise KeyError(f"Unknown primary key: '{primary_key}'")
-    if value not in list_column_values(
-        cns.cluster,
+    error = _sanitize(cns.cluster, keyspace, table, primary_key=primary_key)
+    if error is not None:
+        raise KeyError(error)
+
+    # query sanitized, so ignore S608
+    exists = _prepare(
         cns.session,
-        keyspace,
-        table,
-        primary_key,
-    ):
+        f"SELECT {primary_key} FROM {keyspace}.{table} "  # noqa: S608
+        f"WHERE {primary_key} = ? LIMIT 1",
+    )
+    if cns.session.execute(exists, [value]).one() is None:
         raise KeyError(f"Unknown primary key value: '{value}'")
 
+    delete = _prepare(
+        cns.session,
+        f"DELETE FROM {keyspace}.{table} WHERE {primary_key} = ?",  # noqa: S608
+    )
+    cns.session.execute(delete, [value])
+
+
+def drop_row_by_pks(cns, keyspace, table, pk_values):
+    """Drop(delete) a cassandra table row identified by its primary key(s).
+
+    Supports composite primary keys. All partition key columns have to be
+    given. Trailing clustering key columns may be left out to delete a range
+    of rows, but the given ones have to form a prefix of the clustering key.
+    Unlike :func:`drop_row`, the row's existence is not checked, so the row
+    is deleted in a single round trip.
+
+    Parameters
+    ----------
+    cns: ~typing.NamedTuple
+        Tuple of `cassandra.session.Cluster
+        <https://docs.datastax.com/en/developer/python-driver/3.18/api/cassandra/cluster/#cassandra.cluster.Cluster>`_
+        and `cassandra.session.Session
+        <https://docs.datastax.com/en/developer/python-driver/3.18/api/cassandra/cluster/#cassandra.cluster.Session>`_
+        as in ``('cluster'=cluster, 'session'=session)`` and returned by
+        :func:`cassy.casdriv.connect_session`.
+    keyspace: str
+        String specifying the default keyspace the
+        :paramref:`~drop_row_by_pks.table` is found.
+    table: str
+        String specifying the table of which to drop a row.
+    pk_values: dict
+        Dictionairy mapping the primary key labels to the values of the row
+        to be dropped.
+
+    Raises
+    ------
+    KeyError
+        Key Error raised if :paramref:`~drop_row_by_pks.keyspace`,
+        :paramref:`~drop_row_by_pks.table` or any of the
+        :paramref:`~drop_row_by_pks.pk_values` keys are unsuccesfully
+        white-listed, if a partition key is missing in
+        :paramref:`~drop_row_by_pks.pk_values` or if the given clustering
+        keys are no prefix of the clustering key.
+
+    Examples
+    --------
+    Dropping a row from the Martin Crawford database assuming a cluster and
+    session were created using :func:`cassy.casdriv.connect_session`::
+
+        drop_row_by_pks(
+            cns=(cluster, session),
+            keyspace="crawford",
+            table="common_fruiting_trees",
+            pk_values={"latin": "Prunus domestica", "english": "Plum"},
+        )
+    """
+    error = _sanitize(cns.cluster, keyspace, table)
+    if error is not None:
+        raise KeyError(error)
+    table_meta = cns.cluster.metadata.keyspaces[keyspace].tables[table]
+
+    pk_names = [key.name for key in table_meta.primary_key]
+    for name in pk_values:
+        if name not in pk_names:
+            raise KeyError(f"Unknown primary key: '{name}'")
+    for key in table_meta.partition_key:
+        if key.name not in pk_values:
+            raise KeyError(f"Missing partition key: '{key.name}'")
+    # cassandra only deletes ranges of a clustering key prefix
+    missing = None
+    for key in table_meta.clustering_key:
+        if key.name not in pk_values:
+            missing = missing or key.name
+        elif missing is not None:
+            raise KeyError(f"Clustering key '{key.name}' given without '{missing}'")
+
+    # bind in table order, so each table needs one prepared statement only
+    names = [name for name in pk_names if name in pk_values]
+    where = " AND ".join(f"{protect_name(name)} = ?" for name in names)
+
     # query sanitized, so ignore S608
-    cns.session.execute(
-        f"DELETE FROM {keyspace}.{table} WHERE {primary_key} = '{value}'"  # noqa: S608
+    delete = _prepare(
+        cns.session,
+        f"DELETE FROM {protect_name(keyspace)}.{protect_name(table)} "  # noqa: S608
+        f"WHERE {where}",
     )
+    cns.session.execute(delete, [pk_values[name] for name in names])
 
 
 def drop_all_rows(cluster, session, keyspace, table):
@@ -227,9 +336,8 @@ def drop_all_rows(cluster, session, keyspace, table):
         Key Error raised if :paramref:`~drop_all_rows.keyspace` or
         :paramref:`~drop_all_rows.table` are unsuccesfully white-listed.
     """
-    if keyspace not in list_cluster_keyspaces(cluster):
-        raise KeyError(f"Unknown keyspace: '{keyspace}'")
-    if table not in list_keyspace_tables(cluster, keyspace):
-        raise KeyError(f"Unknown table: '{table}'")
+    error = _sanitize(cluster, keyspace, table)
+    if error is not None:
+        raise KeyError(error)
 
-    session.execute(f"TRUNCATE {keyspace}.{table}")
+    session.execute(_prepare(session, f"TRUNCATE {keyspace}.{table}"))
@@ -1,17 +1,39 @@
 # src/fogdb/dbs/cassy.py
 """Module fo dynamically creating hardcoded data models."""
 
+import errno
+import hashlib
 import importlib
 import logging
+import os
+import py_compile
+import sys
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from itertools import chain
 from pathlib import Path
 from shutil import copy2
 from uuid import uuid4
 
+from cassandra.cqlengine import columns as cql_columns
+from cassandra.cqlengine.models import Model
+
 logger = logging.getLogger(__name__)
 
+# static part of every generated model module's header
+_HEADER = (
+    b"# automatically created using cassy\n"
+    b"from cassandra.cqlengine import columns\n"
+    b"from cassandra.cqlengine.models import Model\n\n\n"
+)
+
+# column line templates, filled with (name, data type[, clustering order])
+_PK_FMT = "    %s = columns.%s(primary_key=True)\n"
+_CK_FMT = "    %s = columns.%s(primary_key=True, clustering_order='%s')\n"
+_COL_FMT = "    %s = columns.%s()\n"
 
-@dataclass
+
+@dataclass(frozen=True)
 class MetaModel:
     """Dynamically create a table model.
 
@@ -49,6 +71,12 @@ class MetaModel:
         <https://docs.datastax.com/en/developer/python-dse-driver/2.11/api/dse/cqlengine/columns/#column-types>`_
         for available datatypes.
 
+    Notes
+    -----
+    Meta models are frozen and hashable. The key and column dictionairies
+    are copied on creation and are not to be mutated afterwards. Meta models
+    are equal, if their names, keys and columns are equal in that order.
+
     Examples
     --------
     Default use case::
@@ -74,64 +102,115 @@ class MetaModel:
     clustering_keys: dict
     columns: dict
 
+    def __post_init__(self):
+        """Copy the given dicts, so the meta model does not share them."""
+        # frozen, so fields can only be set circumventing __setattr__
+        for name in ("primary_keys", "clustering_keys", "columns"):
+            object.__setattr__(self, name, dict(getattr(self, name)))
+
+    @property
+    def _key(self):
+        # hashable, order preserving representation, clustering key types
+        # and orders may be given as lists
+        return (
+            self.name,
+            tuple(self.primary_keys.items()),
+            tuple(
+                (name, tuple(type_and_order))
+                for name, type_and_order in self.clustering_keys.items()
+            ),
+            tuple(self.columns.items()),
+        )
 
-def _write_model_lines(meta_model, path):
-    lines_to_write = [
-        f"# {path}\n",
-        "# automatically created using cassy\n",
-        "from cassandra.cqlengine import columns\n",
-        "from cassandra.cqlengine.models import Model\n\n\n",
-        f"class {meta_model.name}(Model):\n",
-    ]
-    for column_name, column_data_type in meta_model.primary_keys.items():
-        line = f"    {column_name} = columns.{column_data_type}(primary_key=True)\n"
-        lines_to_write.append(line)
-
-    for column_name, column_data_type in meta_model.clustering_keys.items():
-        # pylint: disable=line-too-long
-        line = f"    {column_name} = columns.{column_data_type[0]}(primary_key=True, clustering_order='{column_data_type[1]}')\n"
-        lines_to_write.append(line)
-        # pylint: enable=line-too-long
-
-    lines_to_write.append("\n    # Regular Table Columns:\n")
-
-    for column_name, column_data_type in meta_model.columns.items():
-        line = f"    {column_name} = columns.{column_data_type}()\n"
-        lines_to_write.append(line)
+    def __eq__(self, other):
+        """Compare meta models by their (ordered) field values."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # column order matters, so compare the ordered key
+        return self._key == other._key
+
+    def __hash__(self):
+        """Hash the same ordered representation ``__eq__`` compares."""
+        return hash(self._key)
+
+    @cached_property
+    def all_primary_keys(self):
+        """Tuple of the partition and clustering key names, in order."""
+        return (*self.primary_keys, *self.clustering_keys)
+
+    @cached_property
+    def clustering_key_names(self):
+        """Tuple of the clustering key names, in order."""
+        return tuple(self.clustering_keys)
+
+    @cached_property
+    def all_columns(self):
+        """Tuple of all key and column names, in model column order."""
+        return (*self.all_primary_keys, *self.columns)
+
+
+def _read_model_bytes(path):
+    # everything below the path line, which depends on how path was given
+    with open(path, "rb") as file_handle:
+        file_handle.readline()
+        return file_handle.read()
+
+
+# the rendered class only depends on the meta model, the path line does not
+@lru_cache(maxsize=128)
+def _render_model_body(meta_model):
+    class_line = (f"class {meta_model.name}(Model):\n",)
+    ck_items = meta_model.clustering_keys.items()
+    primary_key_lines = map(_PK_FMT.__mod__, meta_model.primary_keys.items())
+    clustering_key_lines = map(
+        _CK_FMT.__mod__,
+        ((name, *type_and_order) for name, type_and_order in ck_items),
+    )
+    column_lines = map(_COL_FMT.__mod__, meta_model.columns.items())
+
+    body = "".join(
+        chain(
+            class_line,
+            primary_key_lines,
+            clustering_key_lines,
+            ("\n    # Regular Table Columns:\n",),
+            column_lines,
+        )
+    )
 
-    return lines_to_write
+    return body.encode("utf8")
 
 
-def _handle_path(path, overwrite=False, backup=True):
+def _expand_path(path):
 
     if str(path).startswith("~"):  # pragma: no cover
         # coverage is excluded here, cause this part definetly gets
         # executed and tested. I might be overlooking something,
         # tests/db_api/test_model.test_create_model_design_case
         # uses "~" as first path element, so Im not sure, whats happening
-        output_path = Path(path).expanduser()
-    else:
-        output_path = Path(path).resolve()
+        return Path(path).expanduser()
 
-    if output_path.is_file():
-        logger.debug("Existing file detected at %s", output_path)
+    return Path(path).resolve()
 
-        if not overwrite:
-            error_msg = f"Existing file at {output_path}\n"
-            fix_msg = "Set 'overwrite=True' or change filepath"
-            raise FileExistsError(error_msg + fix_msg)
-        if backup:
-            # create uid for not overwriting existing backups
-            uid = str(uuid4())
-            otp = output_path  # shortcut the output_path for one liner below
-            parent, name, extension = otp.parent, otp.stem, "".join(otp.suffixes)
-            backup_name = "_backup_".join([name, uid])
-            backup_path = Path(parent) / "".join([backup_name, extension])
 
-            logger.debug("Copying exsting file to  %s", backup_path)
-            copy2(src=otp, dst=backup_path)
+def _backup_file(output_path):
 
-    return output_path
+    # create uid for not overwriting existing backups
+    uid = str(uuid4())
+    otp = output_path  # shortcut the output_path for one liner below
+    parent, name, extension = otp.parent, otp.stem, "".join(otp.suffixes)
+    backup_name = "_backup_".join([name, uid])
+    backup_path = Path(parent) / "".join([backup_name, extension])
+
+    # file gets rewritten anyway, so moving it suffices
+    logger.debug("Moving exsting file to  %s", backup_path)
+    try:
+        os.replace(otp, backup_path)
+    except OSError as err:  # pragma: no cover
+        # backup is a sibling, so this only happens on odd mounts
+        if err.errno != errno.EXDEV:
+            raise
+        copy2(src=otp, dst=backup_path)
 
 
 def create_data_model(meta_model, path, overwrite=False, backup=True):
@@ -162,6 +241,19 @@ def create_data_model(meta_model, path, overwrite=False, backup=True):
     pathlib.Path
         Path the hardcoded data model file was created at.
 
+    Raises
+    ------
+    FileExistsError
+        Raised if a different model is already hardcoded at
+        :paramref:`~create_data_model.path` and
+        :paramref:`~create_data_model.overwrite` is False.
+
+    Notes
+    -----
+    Creating a model at a path already holding the identical model module,
+    without overwriting, is a no-op. Only the leading path comment may
+    differ.
+
     Examples
     --------
     Default use case::
@@ -182,18 +274,94 @@ def create_data_model(meta_model, path, overwrite=False, backup=True):
             overwrite=True,
         )
     """
-    lines_to_write = _write_model_lines(meta_model, path)
-    output_path = _handle_path(path, overwrite, backup)
+    output_path = _expand_path(path)
+    model_bytes = _HEADER + _render_model_body(meta_model)
+
+    if output_path.is_file():
+        logger.debug("Existing file detected at %s", output_path)
+
+        if not overwrite:
+            # compare the module itself, so hand edited files are not skipped
+            if _read_model_bytes(output_path) == model_bytes:
+                logger.debug("Identical model already hardcoded at %s", output_path)
+                return output_path
+
+            error_msg = f"Existing file at {output_path}\n"
+            fix_msg = "Set 'overwrite=True' or change filepath"
+            raise FileExistsError(error_msg + fix_msg)
+        if backup:
+            _backup_file(output_path)
 
-    with open(output_path, "w+", encoding="utf8") as file_handle:
-        file_handle.writelines(lines_to_write)
+    with open(output_path, "wb") as file_handle:
+        file_handle.write(f"# {path}\n".encode("utf8") + model_bytes)
+
+    # populate __pycache__, so retrieve_data_model skips parsing
+    py_compile.compile(str(output_path), doraise=True)
 
     return output_path
 
 
+def build_data_model(meta_model):
+    """Build a data model in memory, without hardcoding it to a file.
+
+    The model class is equivalent to the one retrieved after
+    :func:`create_data_model`. Models are cached, so building from equal
+    meta models returns the same model class.
+
+    Parameters
+    ----------
+    meta_model: :class:`MetaModel`
+        dataclass describing the model data.
+
+    Returns
+    -------
+    DataModel
+        `Datastax Cassandry Cqlenine Data Model
+        <https://docs.datastax.com/en/developer/python-driver/3.25/api/cassandra/cqlengine/models/>`_
+        described by :paramref:`~build_data_model.meta_model`.
+
+    Examples
+    --------
+    Default use case::
+
+        model = build_data_model(meta_model=my_meta_model)
+    """
+    return _build_data_model(meta_model)
+
+
+@lru_cache(maxsize=128)
+def _build_data_model(meta_model):
+    attrs = {
+        "__table_name__": meta_model.name,
+        "__table_name_case_sensitive__": True,
+    }
+    # columns are ordered by creation, so create them as a file would
+    for column_name, column_data_type in meta_model.primary_keys.items():
+        column_type = getattr(cql_columns, column_data_type)
+        attrs[column_name] = column_type(primary_key=True)
+
+    ck_items = meta_model.clustering_keys.items()
+    for column_name, (column_data_type, clustering_order) in ck_items:
+        column_type = getattr(cql_columns, column_data_type)
+        attrs[column_name] = column_type(
+            primary_key=True, clustering_order=clustering_order
+        )
+
+    for column_name, column_data_type in meta_model.columns.items():
+        attrs[column_name] = getattr(cql_columns, column_data_type)()
+
+    return type(meta_model.name, (Model,), attrs)
+
+
 def retrieve_data_model(path, model_name):
     """Retrieve previously hardcoded data model.
 
+    Retrieved models are cached by path, modification time, size, inode and
+    name. Hence retrieving an unchanged model file again returns the same
+    model class without re-executing the module. The module is registered
+    as ``cassy._models.<file stem>_<path hash>``, so it never shadows an
+    installed module or a model file of the same name elsewhere.
+
     Parameters
     ----------
     path: pathlib.Path, str
@@ -218,16 +386,36 @@ def retrieve_data_model(path, model_name):
             model_name="CrawfordCommonFruitingTrees",
         )
     """
-    input_path = Path(path).expanduser()
-
+    input_path = Path(path).expanduser().resolve()
+    stat = input_path.stat()
+    # mtimes may be coarse, so also key by size and inode, to notice files
+    # rewritten within the same tick
+    file_id = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    return _load_data_model(input_path, file_id, model_name)
+
+
+# file_id is only part of the cache key, so overwritten files get reloaded
+@lru_cache(maxsize=128)
+def _load_data_model(input_path, file_id, model_name):
+    # pylint: disable=unused-argument
+    # the source file loader reads the __pycache__ entry create_data_model
+    # compiled, even when sys.dont_write_bytecode is set
+    # namespaced, so model files named like real modules do not shadow them,
+    # and keyed by path, so equally named files do not replace each other
+    path_digest = hashlib.sha256(str(input_path).encode("utf8")).hexdigest()
     spec = importlib.util.spec_from_file_location(
-        input_path.stem,
+        f"cassy._models.{input_path.stem}_{path_digest[:16]}",
         str(input_path),
     )
     module = importlib.util.module_from_spec(spec)
 
-    # sys.modules[module_name] = module
-    spec.loader.exec_module(module)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(spec.name, None)
+        raise
 
     model = getattr(module, model_name)
     model.__table_name__ = model_name
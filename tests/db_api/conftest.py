@@ -1,47 +1,360 @@
 # tests/db_api/conftest.py
-# pylint: disable=protected-access
 # pylint: disable=import-error
 # pylint: disable=redefined-outer-name
 """Configure and setup cassy api testings."""
-from collections import namedtuple
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
 
 import ccmlib.cluster
+import ccmlib.cluster_factory
 import pytest
+from cassandra.cluster import EXEC_PROFILE_DEFAULT, ExecutionProfile
+from cassandra.concurrent import execute_concurrent_with_args
+from cassandra.policies import DCAwareRoundRobinPolicy, TokenAwarePolicy
+from filelock import FileLock
 
 import cassy.casdriv as cassy_driv
 
+# pytest-xdist worker running the tests, "gw0" when running without xdist
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+CLUSTER_NAME = "pytest_tmp_cluster"
+CASSANDRA_VERSION = "4.0.4"
+
+# test data is ephemeral, so keep fsyncs and heap pressure off the write path
+CASSANDRA_OPTIONS = {
+    "commitlog_sync": "periodic",
+    "commitlog_sync_period_in_ms": 10000,
+    "memtable_allocation_type": "offheap_objects",
+}
+
+# plant table the cql tests are seeded with, identifiers can not be bound
+_CREATE_TPL = (
+    "CREATE TABLE IF NOT EXISTS {ks}.{tbl} "
+    "(latin text, english text, german text, PRIMARY KEY ({pk}))"
+)
+
+# cluster booted in the background by pytest_collection_finish, and its path
+_CLUSTER_BOOT = pytest.StashKey()
+_BOOT_PATH = pytest.StashKey()
+_BOOT_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
+def _start_cluster(cluster_path, snapshot_root):
+    """Start the test cluster, restoring it from snapshot if available.
+
+    The first boot populates a fresh cluster and snapshots its stopped
+    directory, so later runs skip populating and initializing the node.
+
+    Parameters
+    ----------
+    cluster_path: pathlib.Path
+        Directory the cluster is created in.
+    snapshot_root: pathlib.Path
+        Directory the cluster snapshot is kept in.
+
+    Returns
+    -------
+    ccmlib.cluster.Cluster
+        The started cluster.
+    """
+    snapshot_path = snapshot_root / CLUSTER_NAME
+
+    with FileLock(str(snapshot_root / "snapshot.lock")):
+        if snapshot_path.is_dir():
+            shutil.copytree(snapshot_path, cluster_path / CLUSTER_NAME)
+            cluster = ccmlib.cluster_factory.ClusterFactory.load(
+                str(cluster_path), CLUSTER_NAME
+            )
+            # rewrite the node configs, still pointing at the snapshot's origin
+            cluster.set_configuration_options(CASSANDRA_OPTIONS)
+        else:
+            cluster = ccmlib.cluster.Cluster(
+                cluster_path, CLUSTER_NAME, cassandra_version=CASSANDRA_VERSION
+            )
+            cluster.populate(1, ipprefix="127.0.1.")
+            cluster.set_configuration_options(CASSANDRA_OPTIONS)
+            cluster.start(timeout=300)
+            cluster.stop()
+            shutil.copytree(cluster_path / CLUSTER_NAME, snapshot_path)
+
+    cluster.start(timeout=300)
+
+    return cluster
+
+
+def _snapshot_root(config):
+    return config.cache.mkdir(f"ccm_snapshot_{CASSANDRA_VERSION}")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    """Mark all tests using the cluster as integration tests."""
+    for item in items:
+        if "ccmlib_cluster" in item.fixturenames:
+            item.add_marker(pytest.mark.integration)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_finish(session):
+    """Start booting the test cluster, while the first tests are running."""
+    config = session.config
+    if getattr(config.option, "dist", "no") != "no":
+        # pytest-xdist workers boot the shared cluster in ccmlib_cluster
+        return
+    if not any("ccmlib_cluster" in item.fixturenames for item in session.items):
+        return
+
+    # removed by pytest_unconfigure, like the cluster itself
+    cluster_path = Path(tempfile.mkdtemp(prefix="clusterp"))
+    config.stash[_BOOT_PATH] = cluster_path
+    config.stash[_CLUSTER_BOOT] = _BOOT_EXECUTOR.submit(
+        _start_cluster, cluster_path, _snapshot_root(config)
+    )
+
+
+def pytest_unconfigure(config):
+    """Remove the cluster booted in the background, along with its directory."""
+    boot = config.stash.get(_CLUSTER_BOOT, None)
+    if boot is not None and boot.exception() is None:
+        print("teardown cluster")
+        boot.result().remove()
+    cluster_path = config.stash.get(_BOOT_PATH, None)
+    if cluster_path is not None:
+        shutil.rmtree(cluster_path, ignore_errors=True)
+
+
+def _with_contacts(cluster):
+    # single node cluster, so its binary interface is the only contact point
+    address, port = cluster.nodelist()[0].network_interfaces["binary"]
+    return SimpleNamespace(cluster=cluster, bnry_contacts=[address], bnry_port=port)
+
 
 # pylint: enable=import-error
 @pytest.fixture(scope="session")
-def ccmlib_cluster(tmp_path_factory):
-    """Create cassandra cluster on temp directory."""
-    cluster_path = tmp_path_factory.mktemp("clusterp")
-    cluster = ccmlib.cluster.Cluster(
-        cluster_path, "pytest_tmp_cluster", cassandra_version="4.0.4"
-    )
+def ccmlib_cluster(tmp_path_factory, pytestconfig):
+    """Create cassandra cluster on temp directory.
+
+    The freshly populated cluster is snapshotted into the pytest cache
+    directory once, following boots restore it from there. Use
+    ``pytest --cache-clear`` to boot from scratch again.
+
+    Without pytest-xdist, the cluster is booted in the background by
+    :func:`pytest_collection_finish` already, as soon as any selected test
+    needs it.
+    When running distributed, the first worker boots the cluster and the
+    others attach to it. The last worker finishing removes it.
 
-    cluster.populate(1, ipprefix="127.0.1.").start(timeout=300)
+    Parameters
+    ----------
+    tmp_path_factory: pytest.TempPathFactory
+        Provides the base temp directory shared by all workers.
+    pytestconfig: pytest.Config
+        Holds the cluster booted by :func:`pytest_collection_finish`.
 
-    cluster._bnry_contacts = [
-        node.network_interfaces["binary"][0] for node in cluster.nodelist()
-    ]
-    cluster._bnry_port = cluster.nodelist()[0].network_interfaces["binary"][1]
+    Yields
+    ------
+    types.SimpleNamespace
+        Namespace holding the ccm ``cluster`` as well as its
+        ``bnry_contacts`` and ``bnry_port`` to connect the driver to.
+    """
+    if _CLUSTER_BOOT in pytestconfig.stash:
+        yield _with_contacts(pytestconfig.stash[_CLUSTER_BOOT].result())
+        return
 
-    yield cluster
+    # the parent of a worker's basetemp is shared by all workers of a run
+    shared_path = tmp_path_factory.getbasetemp().parent
+    state_file = shared_path / "cluster.json"
+    lock = FileLock(str(shared_path / "cluster.lock"))
 
-    print("teardown cluster")
-    cluster.remove()
+    with lock:
+        if state_file.is_file():
+            state = json.loads(state_file.read_text())
+            cluster = ccmlib.cluster_factory.ClusterFactory.load(
+                state["path"], CLUSTER_NAME
+            )
+        else:
+            cluster_path = shared_path / "clusterp"
+            cluster_path.mkdir(exist_ok=True)
+            cluster = _start_cluster(cluster_path, _snapshot_root(pytestconfig))
+            state = {"path": str(cluster_path), "workers": 0}
+        state["workers"] += 1
+        state_file.write_text(json.dumps(state))
+
+    yield _with_contacts(cluster)
+
+    with lock:
+        state = json.loads(state_file.read_text())
+        state["workers"] -= 1
+        if state["workers"]:
+            state_file.write_text(json.dumps(state))
+        else:
+            print("teardown cluster")
+            cluster.remove()
+            state_file.unlink()
 
 
 @pytest.fixture(scope="session")
-def casdriv_cns(ccmlib_cluster):
+def cluster_options():
+    """Provide the driver options the test session is connected with."""
+    profile = ExecutionProfile(
+        load_balancing_policy=TokenAwarePolicy(DCAwareRoundRobinPolicy()),
+        request_timeout=10,
+    )
+
+    return {
+        "protocol_version": 4,
+        "execution_profiles": {EXEC_PROFILE_DEFAULT: profile},
+    }
+
+
+@pytest.fixture(scope="session")
+def casdriv_cns(ccmlib_cluster, cluster_options):
     """Test getting cluster object with a connected session using casriv."""
     cluster, session = cassy_driv.connect_session(
-        ips=ccmlib_cluster._bnry_contacts,
-        port=ccmlib_cluster._bnry_port,
+        ips=ccmlib_cluster.bnry_contacts,
+        port=ccmlib_cluster.bnry_port,
+        **cluster_options,
     )
 
-    yield namedtuple("CnS", ["cluster", "session"])(cluster, session)
+    yield cassy_driv.CnS(cluster, session)
 
     print("disconnect session")
     # session.shutdown()
+
+
+@pytest.fixture(scope="session")
+def connection_name(casdriv_cns):
+    """Provide the cluster name casdriv registered the connection as."""
+    return cassy_driv.get_cluster_name(casdriv_cns.cluster)
+
+
+@pytest.fixture(scope="session")
+def wait_for_keyspace():
+    """Provide a helper waiting for a keyspace to show up in the metadata.
+
+    The driver's cluster metadata is local, so checking it is free. The
+    schema is only refreshed, if the keyspace is not known yet.
+
+    Returns
+    -------
+    ~collections.abc.Callable
+        ``wait(cluster, name, timeout=5.0)`` returning whether the keyspace
+        showed up before the timeout.
+    """
+
+    def _wait(cluster, name, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        if name not in cluster.metadata.keyspaces:
+            cluster.refresh_schema_metadata(max_schema_agreement_wait=0)
+        while name not in cluster.metadata.keyspaces:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    return _wait
+
+
+@pytest.fixture(scope="session")
+def simple_keyspace(connection_name):
+    """Create the keyspace shared by all non mutating tests once."""
+    kspace = f"pytest_{WORKER_ID}_casdriv_simple_keyspace"
+    cassy_driv.create_simple_keyspace(
+        name=kspace,
+        replication_factor=1,
+        durable_writes=False,
+        connections=[connection_name],
+    )
+
+    yield kspace
+
+
+@pytest.fixture(scope="session")
+def fullcycle_keyspace(casdriv_cns, connection_name):
+    """Create the keyspace of the model full cycle tests once.
+
+    Parameters
+    ----------
+    casdriv_cns: cassy.casdriv.CnS
+        Connected cluster and session, dropping the keyspace afterwards.
+    connection_name: str
+        Name of the connection the keyspace is created with.
+
+    Yields
+    ------
+    tuple
+        ``(connection, keyspace)`` tuple to store entries with.
+    """
+    kspace = f"pytest_{WORKER_ID}_casdriv_fullcycle_keyspace"
+    cassy_driv.create_simple_keyspace(
+        name=kspace,
+        replication_factor=1,
+        durable_writes=False,
+        connections=[connection_name],
+    )
+
+    yield connection_name, kspace
+
+    casdriv_cns.session.execute(f"DROP KEYSPACE IF EXISTS {kspace}")
+
+
+@pytest.fixture()
+def mutable_keyspace(casdriv_cns, connection_name):
+    """Create a uniquely named keyspace for a single mutating test."""
+    kspace = f"pytest_mutable_{uuid4().hex}"
+    cassy_driv.create_simple_keyspace(
+        name=kspace,
+        replication_factor=1,
+        durable_writes=False,
+        connections=[connection_name],
+    )
+
+    yield kspace
+
+    casdriv_cns.session.execute(f"DROP KEYSPACE IF EXISTS {kspace}")
+
+
+@pytest.fixture(scope="session")
+def seeded_table(casdriv_cns):
+    """Provide a factory creating a plant table and inserting rows into it.
+
+    Each table is created once per session. Rows are given as
+    ``(latin, english, german)`` tuples. Every row is its own partition
+    (most of the time), so they are inserted concurrently instead of as a
+    batch.
+
+    Parameters
+    ----------
+    casdriv_cns: cassy.casdriv.CnS
+        Connected cluster and session the tables are seeded with.
+
+    Returns
+    -------
+    ~collections.abc.Callable
+        ``seed(keyspace, table, rows, primary_key="latin")`` creating the
+        table if necessary and inserting the rows.
+    """
+    created = set()
+    session = casdriv_cns.session
+
+    def _seed(keyspace, table, rows, primary_key="latin"):
+        if (keyspace, table) not in created:
+            create = _CREATE_TPL.format(ks=keyspace, tbl=table, pk=primary_key)
+            session.execute(create)
+            created.add((keyspace, table))
+
+        # test identifiers only, so ignore S608
+        insert = session.prepare(
+            f"INSERT INTO {keyspace}.{table} (latin, english, german) "  # noqa: S608
+            "VALUES (?, ?, ?)"
+        )
+        execute_concurrent_with_args(session, insert, rows, raise_on_first_error=True)
+
+    return _seed
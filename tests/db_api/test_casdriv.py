@@ -1,5 +1,8 @@
 # tests/db_api/test_casdriv.py
+# pylint: disable=redefined-outer-name
 """Test succesfull local cassandra db setup, used for further testing."""
+from contextlib import contextmanager
+
 import pytest
 from cassandra.cqlengine import columns
 from cassandra.cqlengine.models import Model
@@ -45,38 +48,80 @@ class ClusterPlant(Model):
     german = columns.Text(required=False)
 
 
+@contextmanager
+def model_bound(model, *, keyspace, connection):
+    """Temporarily bind model to keyspace and connection."""
+    old_keyspace, old_connection = model.__keyspace__, model.__connection__
+    model.__keyspace__, model.__connection__ = keyspace, connection
+    try:
+        yield model
+    finally:
+        model.__keyspace__, model.__connection__ = old_keyspace, old_connection
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _synced_models(connection_name, simple_keyspace):
+    """Synchronize the test models with the shared keyspace once."""
+    for model in (Plant, ClusterPlant):
+        cassy_driv.synchronize_model(
+            model=model,
+            keyspace=simple_keyspace,
+            con=connection_name,
+        )
+
+
+@pytest.fixture(scope="module")
+def plant_row_ready(connection_name, simple_keyspace):
+    """Create the plant table holding a canonical row once."""
+    data_dict = {
+        "latin": "test_read_entry",
+        "english": "that was english",
+        "german": "Teste Eintrag lesen",
+    }
+
+    cassy_driv.create_entry(
+        model=Plant,
+        data=data_dict,
+        keyspace=simple_keyspace,
+        con=connection_name,
+    )
+
+    yield data_dict
+
+
 def test_cluster_name(casdriv_cns):
     """Test correct cluster name getting of casriv."""
     name = cassy_driv.get_cluster_name(casdriv_cns.cluster)
     assert name == "pytest_tmp_cluster"
 
 
+def test_connect_session_reuse(ccmlib_cluster, cluster_options, casdriv_cns):
+    """Test reusing an existing session when connecting again."""
+    cluster, session = cassy_driv.connect_session(
+        ips=ccmlib_cluster.bnry_contacts,
+        port=ccmlib_cluster.bnry_port,
+        **cluster_options,
+    )
+    assert cluster is casdriv_cns.cluster
+    assert session is casdriv_cns.session
+
+
 @pytest.mark.dependency()
-def test_keyspace_simple_creation(casdriv_cns):
+def test_keyspace_simple_creation(casdriv_cns, simple_keyspace, wait_for_keyspace):
     """Test creating a keyspace using casdriv."""
-    kspace = "pytest_casdriv_simple_keyspace"
-    cassy_driv.create_simple_keyspace(
-        name=kspace,
-        replication_factor=1,
-        connections=[casdriv_cns.cluster.metadata.cluster_name],
-    )
-    keyspaces = casdriv_cns.cluster.metadata.keyspaces
-    assert kspace in keyspaces
+    assert wait_for_keyspace(casdriv_cns.cluster, simple_keyspace)
 
 
-@pytest.mark.dependency(depends=["test_keyspace_simple_creation"])
-def test_list_cluster_keyspaces(casdriv_cns):
+def test_list_cluster_keyspaces(casdriv_cns, simple_keyspace):
     """Test casdriv list_cluster_keyspaces utility."""
     listed = cassy_driv.list_cluster_keyspaces(casdriv_cns.cluster)
-    kspace = "pytest_casdriv_simple_keyspace"
-    assert kspace in listed
+    assert simple_keyspace in listed
 
 
 @pytest.mark.dependency(depends=["test_keyspace_simple_creation"])
-def test_create_entry(casdriv_cns):
+def test_create_entry(casdriv_cns, connection_name, simple_keyspace):
     """Test creating a db entry using create_entry."""
-    kspace = "pytest_casdriv_simple_keyspace"
-    connection = cassy_driv.get_cluster_name(casdriv_cns.cluster)
+    kspace = simple_keyspace
 
     data_dict = {
         "latin": "lupulus",
@@ -89,7 +134,7 @@ def test_create_entry(casdriv_cns):
         data=data_dict,
         prior_syncing=True,
         keyspace=kspace,
-        con=connection,
+        con=connection_name,
     )
 
     keyspace_tables = cassy_driv.list_keyspace_tables(
@@ -100,10 +145,9 @@ def test_create_entry(casdriv_cns):
 
 
 @pytest.mark.dependency(depends=["test_create_entry"])
-def test_create_entry_without_syncing(casdriv_cns):
+def test_create_entry_without_syncing(casdriv_cns, connection_name, simple_keyspace):
     """Test creating a db entry using create_entry."""
-    kspace = "pytest_casdriv_simple_keyspace"
-    connection = cassy_driv.get_cluster_name(casdriv_cns.cluster)
+    kspace = simple_keyspace
 
     data_dict = {
         "latin": "lupulus",
@@ -115,7 +159,7 @@ def test_create_entry_without_syncing(casdriv_cns):
         model=Plant,
         data=data_dict,
         keyspace=kspace,
-        con=connection,
+        con=connection_name,
     )
 
     keyspace_tables = cassy_driv.list_keyspace_tables(
@@ -126,10 +170,9 @@ def test_create_entry_without_syncing(casdriv_cns):
 
 
 @pytest.mark.dependency(depends=["test_keyspace_simple_creation"])
-def test_create_cluster_entry(casdriv_cns):
+def test_create_cluster_entry(casdriv_cns, connection_name, simple_keyspace):
     """Test creating a db entry using create_entry and clustering keys."""
-    kspace = "pytest_casdriv_simple_keyspace"
-    connection = cassy_driv.get_cluster_name(casdriv_cns.cluster)
+    kspace = simple_keyspace
 
     data_dict = {
         "latin": "Lupulus Lupin",
@@ -137,191 +180,164 @@ def test_create_cluster_entry(casdriv_cns):
         "german": "Hopfen",
     }
 
-    # set ksapce and con manually to test resepctive if clauses
-    ClusterPlant.__keyspace__ = kspace
-    ClusterPlant.__connection__ = connection
-
-    cassy_driv.create_entry(
-        model=ClusterPlant,
-        data=data_dict,
-        prior_syncing=True,
-    )
+    # bind ksapce and con to the model to test resepctive if clauses
+    with model_bound(ClusterPlant, keyspace=kspace, connection=connection_name):
+        cassy_driv.create_entry(
+            model=ClusterPlant,
+            data=data_dict,
+            prior_syncing=True,
+        )
 
-    keyspace_tables = cassy_driv.list_keyspace_tables(
-        cluster=casdriv_cns.cluster,
-        keyspace=kspace,
-    )
-    assert "cluster_plant" in keyspace_tables
+        keyspace_tables = cassy_driv.list_keyspace_tables(
+            cluster=casdriv_cns.cluster,
+            keyspace=kspace,
+        )
+        assert "cluster_plant" in keyspace_tables
 
-    hops_entry = cassy_driv.read_entry(
-        model=ClusterPlant,
-        primary_keys=("latin", "english"),
-        values=("Lupulus Lupin", "Hops"),
-    )
+        hops_entry = cassy_driv.read_entry(
+            model=ClusterPlant,
+            primary_keys=("latin", "english"),
+            values=("Lupulus Lupin", "Hops"),
+        )
     assert data_dict["latin"] == hops_entry.latin
     assert data_dict["latin"] != hops_entry.english
     # pylint: disable=protected-access
     assert "english" in hops_entry._clustering_keys
     # pylint: enable=protected-access
 
-    # reset ksapce and con to not influence other tests
-    ClusterPlant.__keyspace__ = None
-    ClusterPlant.__connection__ = None
-
-
-@pytest.mark.dependency(depends=["test_create_entry"])
-def test_read_entry(casdriv_cns):
-    """Test creating a db entry using create_entry."""
-    kspace = "pytest_casdriv_simple_keyspace"
-    connection = cassy_driv.get_cluster_name(casdriv_cns.cluster)
-
-    data_dict = {
-        "latin": "test_read_entry",
-        "english": "that was english",
-        "german": "Teste Eintrag lesen",
-    }
-
+    # reading by partition key only matches both hops entries
     cassy_driv.create_entry(
-        model=Plant,
-        data=data_dict,
-        prior_syncing=True,
+        model=ClusterPlant,
+        data={"latin": "Lupulus Lupin", "english": "Hop", "german": "Hopfen"},
         keyspace=kspace,
-        con=connection,
+        con=connection_name,
     )
+    with pytest.raises(ClusterPlant.MultipleObjectsReturned):
+        cassy_driv.read_entry(
+            model=ClusterPlant,
+            primary_keys="latin",
+            values="Lupulus Lupin",
+            keyspace=kspace,
+            con=connection_name,
+        )
 
-    keyspace_tables = cassy_driv.list_keyspace_tables(
-        cluster=casdriv_cns.cluster,
-        keyspace=kspace,
-    )
-    assert "plant" in keyspace_tables
+
+def test_read_entry(connection_name, simple_keyspace, plant_row_ready):
+    """Test creating a db entry using create_entry."""
+    kspace = simple_keyspace
 
     # use keyspace and con arguments to test if clauses
     entry = cassy_driv.read_entry(
         model=Plant,
         primary_keys="latin",
-        values="test_read_entry",
+        values=plant_row_ready["latin"],
         keyspace=kspace,
-        con=connection,
+        con=connection_name,
     )
-    assert "Teste Eintrag lesen" in entry.german
+    assert plant_row_ready["german"] in entry.german
 
+    # use a primary key and value dictionairy
+    entry = cassy_driv.read_entry(
+        model=Plant,
+        primary_keys={"latin": plant_row_ready["latin"]},
+        keyspace=kspace,
+        con=connection_name,
+    )
+    assert plant_row_ready["german"] in entry.german
 
-@pytest.mark.dependency(depends=["test_create_entry"])
-def test_read_entry_exception(casdriv_cns):
-    """Test creating a db entry using create_entry."""
-    kspace = "pytest_casdriv_simple_keyspace"
-    connection = cassy_driv.get_cluster_name(casdriv_cns.cluster)
-
-    data_dict = {
-        "latin": "test_read_entry",
-        "english": "that was english",
-        "german": "Teste Eintrag lesen",
-    }
 
+def test_read_entry_bound_keyspace(
+    connection_name, simple_keyspace, mutable_keyspace, plant_row_ready
+):
+    """Test read_entry following the model's keyspace, if none is given."""
+    mutable_row = {**plant_row_ready, "german": "Teste veraenderlichen Eintrag"}
     cassy_driv.create_entry(
         model=Plant,
-        data=data_dict,
+        data=mutable_row,
         prior_syncing=True,
-        keyspace=kspace,
-        con=connection,
+        keyspace=mutable_keyspace,
+        con=connection_name,
     )
 
-    keyspace_tables = cassy_driv.list_keyspace_tables(
-        cluster=casdriv_cns.cluster,
-        keyspace=kspace,
-    )
-    assert "plant" in keyspace_tables
+    for kspace, row in (
+        (simple_keyspace, plant_row_ready),
+        (mutable_keyspace, mutable_row),
+    ):
+        with model_bound(Plant, keyspace=kspace, connection=connection_name):
+            entry = cassy_driv.read_entry(
+                model=Plant,
+                primary_keys="latin",
+                values=row["latin"],
+            )
+        assert entry.german == row["german"]
+
+
+@pytest.mark.usefixtures("plant_row_ready")
+def test_read_entry_exception(connection_name, simple_keyspace):
+    """Test creating a db entry using create_entry."""
+    kspace = simple_keyspace
 
     # use keyspace and con arguments to test if clauses
-    msg = "no error yet"
-    try:
+    with pytest.raises(
+        ValueError, match="'primary_keys' argument must be of type str or tuple"
+    ):
         cassy_driv.read_entry(
             model=Plant,
             primary_keys=1,
             values=2,
             keyspace=kspace,
-            con=connection,
+            con=connection_name,
         )
-    except ValueError as err:
-        msg = str(err)
 
-    assert "'primary_keys' argument must be of type str or tuple" in msg
+    for primary_keys in ("latin", ("latin", "english")):
+        with pytest.raises(ValueError, match="'values' argument is required"):
+            cassy_driv.read_entry(model=Plant, primary_keys=primary_keys)
 
+    for values in (("only latin",), "latin english"):
+        with pytest.raises(ValueError, match="one value per primary key, 2 in"):
+            cassy_driv.read_entry(
+                model=Plant,
+                primary_keys=("latin", "english"),
+                values=values,
+            )
 
-@pytest.mark.dependency(depends=["test_create_entry"])
-def test_list_primary_keys(casdriv_cns):
-    """Test creating a db entry using create_entry."""
-    kspace = "pytest_casdriv_simple_keyspace"
-    connection = cassy_driv.get_cluster_name(casdriv_cns.cluster)
-
-    data_dict = {
-        "latin": "test_list_primary_keys",
-        "english": "that was english",
-        "german": "Teste Primaerschluessel auflisten",
-    }
+    with pytest.raises(Plant.DoesNotExist):
+        cassy_driv.read_entry(
+            model=Plant,
+            primary_keys="latin",
+            values="not a plant",
+            keyspace=kspace,
+            con=connection_name,
+        )
 
-    cassy_driv.create_entry(
-        model=Plant,
-        data=data_dict,
-        prior_syncing=True,
-        keyspace=kspace,
-        con=connection,
-    )
 
+@pytest.mark.usefixtures("plant_row_ready")
+def test_list_primary_keys(casdriv_cns, simple_keyspace):
+    """Test creating a db entry using create_entry."""
     prim_keys = cassy_driv.list_table_primary_keys(
         cluster=casdriv_cns.cluster,
-        keyspace=kspace,
+        keyspace=simple_keyspace,
         table="plant",
     )
     assert "latin" in prim_keys
 
 
-@pytest.mark.dependency(depends=["test_create_entry"])
-def test_list_table_columns(casdriv_cns):
+@pytest.mark.usefixtures("plant_row_ready")
+def test_list_table_columns(casdriv_cns, simple_keyspace):
     """Test creating a db entry using create_entry."""
-    kspace = "pytest_casdriv_simple_keyspace"
-    connection = cassy_driv.get_cluster_name(casdriv_cns.cluster)
-
-    data_dict = {
-        "latin": "test_list_primary_keys",
-        "english": "that was english",
-        "german": "Teste Primaerschluessel auflisten",
-    }
-
-    cassy_driv.create_entry(
-        model=Plant,
-        data=data_dict,
-        prior_syncing=True,
-        keyspace=kspace,
-        con=connection,
-    )
-
     prim_keys = cassy_driv.list_table_columns(
         cluster=casdriv_cns.cluster,
-        keyspace=kspace,
+        keyspace=simple_keyspace,
         table="plant",
     )
     assert ["latin", "english", "german"] == list(prim_keys)
 
 
-@pytest.mark.dependency(depends=["test_create_entry"])
-def test_delete_entry(casdriv_cns):
+def test_delete_entry(connection_name, mutable_keyspace):
     """Test deleting a db entry using create_entry."""
-    kspace = "pytest_casdriv_delete_keyspace"
-    connection = cassy_driv.get_cluster_name(casdriv_cns.cluster)
+    kspace = mutable_keyspace
     model_used = Plant
 
-    # create keyspace
-    cassy_driv.create_simple_keyspace(
-        name=kspace,
-        replication_factor=1,
-        connections=[casdriv_cns.cluster.metadata.cluster_name],
-    )
-
-    # assert succesfull creation
-    keyspaces = casdriv_cns.cluster.metadata.keyspaces
-    assert kspace in keyspaces
-
     data_dict = {
         "latin": "test_delete_entry",
         "english": "that was english",
@@ -339,35 +355,35 @@ def test_delete_entry(casdriv_cns):
         "german": "Teste Eintrag auch löschen",
     }
 
-    # create db entries
-    for dicts in [data_dict, data_dict2, data_dict3]:
-        cassy_driv.create_entry(
-            model=model_used,
-            data=dicts,
-            prior_syncing=True,
-            keyspace=kspace,
-            con=connection,
-        )
-
-    # assert successful entry creation
-    keyspace_tables = cassy_driv.list_keyspace_tables(
-        cluster=casdriv_cns.cluster,
+    # create the first db entry syncing the table, the rest concurrently
+    cassy_driv.create_entry(
+        model=model_used,
+        data=data_dict,
+        prior_syncing=True,
         keyspace=kspace,
+        con=connection_name,
     )
-    assert "plant" in keyspace_tables
+    results = cassy_driv.create_entries(
+        model=model_used,
+        data=[data_dict2, data_dict3],
+        keyspace=kspace,
+        con=connection_name,
+        concurrency=32,
+    )
+    assert all(success for success, _ in results)
 
     # assert succesfull to be deleted entry recieving
     entries = cassy_driv.get_all_entries(
         model=model_used,
         keyspace=kspace,
-        con=connection,
+        con=connection_name,
     )
     del_this = cassy_driv.read_entry(
         model=Plant,
         primary_keys="latin",
         values="test_delete_entry",
         keyspace=kspace,
-        con=connection,
+        con=connection_name,
     )
     assert del_this in entries
 
@@ -377,12 +393,12 @@ def test_delete_entry(casdriv_cns):
         primary_keys="latin",
         values="test_delete_entry",
         keyspace=kspace,
-        con=connection,
+        con=connection_name,
     )
     after_del_entries = cassy_driv.get_all_entries(
         model=model_used,
         keyspace=kspace,
-        con=connection,
+        con=connection_name,
     )
 
     # assert succesfull deletion
@@ -394,49 +410,30 @@ def test_delete_entry(casdriv_cns):
         primary_keys="latin",
         values="test_also-delete_entry",
         keyspace=kspace,
-        con=connection,
+        con=connection_name,
     )
     assert also_del_this in entries
 
-    model_used.__connection__ = connection
-    model_used.__keyspace__ = kspace
-
-    # delete entry
-    cassy_driv.delete_entry(
-        model=model_used,
-        primary_keys="latin",
-        values="test_also-delete_entry",
-    )
-    after_del_entries2 = cassy_driv.get_all_entries(
-        model=model_used,
-    )
-
-    # reset model to not interfere with other tests
-    model_used.__connection__ = None
-    model_used.__keyspace__ = None
+    with model_bound(model_used, keyspace=kspace, connection=connection_name):
+        # delete entry
+        cassy_driv.delete_entry(
+            model=model_used,
+            primary_keys="latin",
+            values="test_also-delete_entry",
+        )
+        after_del_entries2 = cassy_driv.get_all_entries(
+            model=model_used,
+        )
 
     # assert succesfull deletion
     assert also_del_this not in after_del_entries2
 
 
-@pytest.mark.dependency(depends=["test_create_entry"])
-def test_get_all_entries(casdriv_cns):
+def test_get_all_entries(connection_name, mutable_keyspace):
     """Test deleting a db entry using casdriv.delete_entry."""
-    kspace = "pytest_casdriv_getall_keyspace"
-    connection = cassy_driv.get_cluster_name(casdriv_cns.cluster)
+    kspace = mutable_keyspace
     model_used = Plant
 
-    # create keyspace
-    cassy_driv.create_simple_keyspace(
-        name=kspace,
-        replication_factor=1,
-        connections=[casdriv_cns.cluster.metadata.cluster_name],
-    )
-
-    # assert succesfull creation
-    keyspaces = casdriv_cns.cluster.metadata.keyspaces
-    assert kspace in keyspaces
-
     data_dict = {
         "latin": "test_getall_entry",
         "english": "that was english",
@@ -448,47 +445,194 @@ def test_get_all_entries(casdriv_cns):
         "german": "Teste Alle Eintraege lesen2",
     }
 
-    # create db entries
-    for dicts in [data_dict, data_dict2]:
-        cassy_driv.create_entry(
-            model=model_used,
-            data=dicts,
-            prior_syncing=True,
-            keyspace=kspace,
-            con=connection,
-        )
-
-    # assert successful entry creation
-    keyspace_tables = cassy_driv.list_keyspace_tables(
-        cluster=casdriv_cns.cluster,
+    # create the first db entry syncing the table, the rest concurrently
+    cassy_driv.create_entry(
+        model=model_used,
+        data=data_dict,
+        prior_syncing=True,
         keyspace=kspace,
+        con=connection_name,
     )
-    assert "plant" in keyspace_tables
+    results = cassy_driv.create_entries(
+        model=model_used,
+        data=[data_dict2],
+        keyspace=kspace,
+        con=connection_name,
+        concurrency=32,
+    )
+    assert all(success for success, _ in results)
 
     # assert succesfull entry recieving using keyspace and con
     expected_values = [data_dict["latin"], data_dict2["latin"]]
     entries = cassy_driv.get_all_entries(
         model=model_used,
         keyspace=kspace,
-        con=connection,
+        con=connection_name,
     )
 
     latin_values = [mod.latin for mod in entries]
     for expected_value in expected_values:
         assert expected_value in latin_values
 
-    # assert succesfull entry recieving NOT using keyspace and con
-    model_used.__connection__ = connection
-    model_used.__keyspace__ = kspace
-
+    # assert succesfull lazy entry recieving
     entries = cassy_driv.get_all_entries(
         model=model_used,
+        keyspace=kspace,
+        con=connection_name,
+        as_iter=True,
     )
+    assert not isinstance(entries, list)
 
-    # reset model values to not interfere with other tests
-    model_used.__connection__ = None
-    model_used.__keyspace__ = None
+    latin_values = [mod.latin for mod in entries]
+    for expected_value in expected_values:
+        assert expected_value in latin_values
+
+    # assert succesfull entry recieving NOT using keyspace and con
+    with model_bound(model_used, keyspace=kspace, connection=connection_name):
+        entries = cassy_driv.get_all_entries(
+            model=model_used,
+        )
 
     latin_values = [mod.latin for mod in entries]
     for expected_value in expected_values:
         assert expected_value in latin_values
+
+
+def test_create_delete_cluster_entries(connection_name, mutable_keyspace):
+    """Test concurrently creating and deleting entries by composite keys."""
+    kspace = mutable_keyspace
+
+    data_dicts = [
+        {"latin": "test_cluster_entries", "english": "first", "german": "Erster"},
+        {"latin": "test_cluster_entries", "english": "second", "german": "Zweiter"},
+    ]
+
+    results = cassy_driv.create_entries(
+        model=ClusterPlant,
+        data=data_dicts,
+        prior_syncing=True,
+        keyspace=kspace,
+        con=connection_name,
+    )
+    assert all(success for success, _ in results)
+
+    results = cassy_driv.delete_entries(
+        model=ClusterPlant,
+        primary_keys=("latin", "english"),
+        values=[("test_cluster_entries", "first")],
+        keyspace=kspace,
+        con=connection_name,
+    )
+    assert all(success for success, _ in results)
+
+    entries = cassy_driv.get_all_entries(
+        model=ClusterPlant,
+        keyspace=kspace,
+        con=connection_name,
+    )
+    assert [entry.english for entry in entries] == ["second"]
+
+
+def test_create_entries_bound_keyspace(
+    connection_name, simple_keyspace, mutable_keyspace
+):
+    """Test create_entries following the model's keyspace, if none is given."""
+    cassy_driv.synchronize_model(
+        model=Plant, keyspace=mutable_keyspace, con=connection_name
+    )
+
+    rows = {
+        simple_keyspace: {"latin": "test_bound_simple", "german": "Einfach"},
+        mutable_keyspace: {"latin": "test_bound_mutable", "german": "Veraenderlich"},
+    }
+    for kspace, row in rows.items():
+        with model_bound(Plant, keyspace=kspace, connection=connection_name):
+            results = cassy_driv.create_entries(model=Plant, data=[row])
+        assert all(success for success, _ in results)
+
+    for kspace, row in rows.items():
+        entry = cassy_driv.read_entry(
+            model=Plant,
+            primary_keys="latin",
+            values=row["latin"],
+            keyspace=kspace,
+            con=connection_name,
+        )
+        assert entry.german == row["german"]
+
+    with pytest.raises(Plant.DoesNotExist):
+        cassy_driv.read_entry(
+            model=Plant,
+            primary_keys="latin",
+            values=rows[simple_keyspace]["latin"],
+            keyspace=mutable_keyspace,
+            con=connection_name,
+        )
+
+    cassy_driv.delete_entries(
+        model=Plant,
+        primary_keys="latin",
+        values=[rows[simple_keyspace]["latin"]],
+        keyspace=simple_keyspace,
+        con=connection_name,
+    )
+
+
+@pytest.mark.dependency(depends=["test_create_entry"])
+def test_create_delete_entries(connection_name, simple_keyspace):
+    """Test concurrently creating and deleting db entries."""
+    kspace = simple_keyspace
+
+    data_dicts = [
+        {"latin": "test_create_entries", "german": "Teste Eintraege anlegen"},
+        {"latin": "test_create_entries2", "english": "bulk", "german": "Masse"},
+    ]
+
+    results = cassy_driv.create_entries(
+        model=Plant,
+        data=data_dicts,
+        keyspace=kspace,
+        con=connection_name,
+    )
+    assert all(success for success, _ in results)
+
+    # inserts are prepared once per session and reused afterwards
+    statements = {res.response_future.query.prepared_statement for _, res in results}
+    results = cassy_driv.create_entries(
+        model=Plant,
+        data=data_dicts,
+        keyspace=kspace,
+        con=connection_name,
+    )
+    assert {
+        res.response_future.query.prepared_statement for _, res in results
+    } == statements
+
+    entry = cassy_driv.read_entry(
+        model=Plant,
+        primary_keys="latin",
+        values="test_create_entries2",
+        keyspace=kspace,
+        con=connection_name,
+    )
+    assert entry.english == "bulk"
+
+    results = cassy_driv.delete_entries(
+        model=Plant,
+        primary_keys="latin",
+        values=["test_create_entries", "test_create_entries2"],
+        keyspace=kspace,
+        con=connection_name,
+    )
+    assert all(success for success, _ in results)
+
+    latin_values = [
+        mod.latin
+        for mod in cassy_driv.get_all_entries(
+            model=Plant,
+            keyspace=kspace,
+            con=connection_name,
+        )
+    ]
+    assert "test_create_entries" not in latin_values
+    assert "test_create_entries2" not in latin_values
@@ -12,20 +12,20 @@ import pytest
 )
 def test_node_status(nname, status_query, result, ccmlib_cluster):
     """Test for expected node initializaton."""
-    node = ccmlib_cluster.nodes[nname]
+    node = ccmlib_cluster.cluster.nodes[nname]
     status = getattr(node, status_query)()
     assert status == result
 
 
 def test_cluster_version(ccmlib_cluster):
     """Test succesful cassandra cluster initializtation."""
-    vers = ccmlib_cluster.version()
+    vers = ccmlib_cluster.cluster.version()
     assert vers == "4.0.4"
 
 
 def test_node_name(ccmlib_cluster):
     """Test succesful cassandra cluster node initializtation."""
-    nodes = ccmlib_cluster.nodelist()
+    nodes = ccmlib_cluster.cluster.nodelist()
     assert nodes[0].name == "node1"
 
 
@@ -39,5 +39,5 @@ def test_node_name(ccmlib_cluster):
 )
 def test_node_network_interfaces(nname, iface, result, ccmlib_cluster):
     """Test for expected node initializaton."""
-    node = ccmlib_cluster.nodes[nname]
+    node = ccmlib_cluster.cluster.nodes[nname]
     assert node.network_interfaces[iface] == result
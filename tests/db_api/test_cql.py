@@ -1,5 +1,7 @@
 # tests/db_api/test_cql.py
 """Test succesfull local cassandra db setup, used for further testing."""
+import pytest
+
 from cassy import cql
 
 
@@ -8,19 +10,21 @@ def test_cluster_name(casdriv_cns):
     name = cql.get_cluster_name(casdriv_cns.session)
     assert name == "pytest_tmp_cluster"
 
+    # cached name
+    assert cql.get_cluster_name(casdriv_cns.session) == name
+
 
-def test_keyspace_simple_creation(casdriv_cns):
+def test_keyspace_simple_creation(casdriv_cns, wait_for_keyspace):
     """Test creating a keyspace using casdriv.create_keyspace."""
     kspace = "pytest_cql_simple_keyspace"
     cql.create_keyspace(
         keyspace=kspace,
         session=casdriv_cns.session,
     )
-    keyspaces = casdriv_cns.cluster.metadata.keyspaces
-    assert kspace in keyspaces
+    assert wait_for_keyspace(casdriv_cns.cluster, kspace)
 
 
-def test_keyspace_replication_creation(casdriv_cns):
+def test_keyspace_replication_creation(casdriv_cns, wait_for_keyspace):
     """Test casdriv.create_keyspace using replication argument."""
     kspace = "pytest_cql_replication_keyspace"
     cql.create_keyspace(
@@ -28,32 +32,21 @@ def test_keyspace_replication_creation(casdriv_cns):
         session=casdriv_cns.session,
         replication="{'class': 'SimpleStrategy', 'replication_factor': 1}",
     )
-    keyspaces = casdriv_cns.cluster.metadata.keyspaces
-    assert kspace in keyspaces
+    assert wait_for_keyspace(casdriv_cns.cluster, kspace)
 
 
-def test_list_column_values(casdriv_cns):
+def test_list_column_values(casdriv_cns, seeded_table):
     """Test cql.list_column_values."""
     kspace = "pytest_cql_simple_keyspace"
     table = "cql_list_column_values"
 
-    # create table
-    casdriv_cns.session.execute(
-        f"""CREATE TABLE IF NOT EXISTS {kspace}.{table} (
-            latin text,
-            english text,
-            german text,
-            PRIMARY KEY (latin)
-        );"""
-    )
-
-    # add values
-    casdriv_cns.session.execute(
-        f"""INSERT INTO {kspace}.{table} (
-            latin,
-            english,
-            german
-        ) VALUES ('deus_ex', 'not_a_plant', 'wasndas')"""
+    # create table and add values
+    seeded_table(
+        kspace,
+        table,
+        [
+            ("deus_ex", "not_a_plant", "wasndas"),
+        ],
     )
 
     latin_values = cql.list_column_values(
@@ -66,34 +59,37 @@ def test_list_column_values(casdriv_cns):
 
     assert "deus_ex" in latin_values
 
+    # statement is prepared once per session and reused afterwards
+    query = f"SELECT latin FROM {kspace}.{table}"
+    # pylint: disable=protected-access
+    prepared = cql._PREPARED[casdriv_cns.session][query]
+    cql.list_column_values(
+        cluster=casdriv_cns.cluster,
+        session=casdriv_cns.session,
+        keyspace=kspace,
+        table=table,
+        column="latin",
+    )
+    assert cql._PREPARED[casdriv_cns.session][query] is prepared
+    # pylint: enable=protected-access
+
 
-def test_list_column_values_exceptions(casdriv_cns):
+def test_list_column_values_exceptions(casdriv_cns, seeded_table):
     """Test cql.list_column_values exception rasising."""
     kspace = "pytest_cql_simple_keyspace"
     table = "cql_list_column_values_exception"
 
-    # create table
-    casdriv_cns.session.execute(
-        f"""CREATE TABLE IF NOT EXISTS {kspace}.{table} (
-            latin text,
-            english text,
-            german text,
-            PRIMARY KEY (latin)
-        );"""
-    )
-
-    # add values
-    casdriv_cns.session.execute(
-        f"""INSERT INTO {kspace}.{table} (
-            latin,
-            english,
-            german
-        ) VALUES ('deus_ex', 'not_a_plant', 'wasndas')"""
+    # create table and add values
+    seeded_table(
+        kspace,
+        table,
+        [
+            ("deus_ex", "not_a_plant", "wasndas"),
+        ],
     )
 
     # keyspace exception
-    kspace_error = table_error = column_error = "no error"
-    try:
+    with pytest.raises(KeyError, match="Unknown keyspace: 'not a keyspace'"):
         cql.list_column_values(
             cluster=casdriv_cns.cluster,
             session=casdriv_cns.session,
@@ -101,11 +97,9 @@ def test_list_column_values_exceptions(casdriv_cns):
             table=table,
             column="latin",
         )
-    except KeyError as err:
-        kspace_error = str(err)
 
     # table excepton
-    try:
+    with pytest.raises(KeyError, match="Unknown table: 'not in here'"):
         cql.list_column_values(
             cluster=casdriv_cns.cluster,
             session=casdriv_cns.session,
@@ -113,11 +107,9 @@ def test_list_column_values_exceptions(casdriv_cns):
             table="not in here",
             column="latin",
         )
-    except KeyError as err:
-        table_error = str(err)
 
     # column exceptin
-    try:
+    with pytest.raises(KeyError, match=r"Unknown column: ';\*/ my injection'"):
         cql.list_column_values(
             cluster=casdriv_cns.cluster,
             session=casdriv_cns.session,
@@ -125,43 +117,27 @@ def test_list_column_values_exceptions(casdriv_cns):
             table=table,
             column=";*/ my injection",
         )
-    except KeyError as err:
-        column_error = str(err)
 
-    assert "Unknown keyspace: 'not a keyspace'" in kspace_error
-    assert "Unknown table: 'not in here'" in table_error
-    assert "Unknown column: ';*/ my injection'" in column_error
+    # identifiers are white-listed before preparing, so nothing got cached
+    # pylint: disable=protected-access
+    prepared_queries = cql._PREPARED.get(casdriv_cns.session, {})
+    # pylint: enable=protected-access
+    assert not any("my injection" in query for query in prepared_queries)
 
 
-def test_get_all_entries(casdriv_cns):
+def test_get_all_entries(casdriv_cns, seeded_table):
     """Test cql.get_all_entries."""
     kspace = "pytest_cql_simple_keyspace"
     table = "cql_get_all_entries"
 
-    # create table
-    casdriv_cns.session.execute(
-        f"""CREATE TABLE IF NOT EXISTS {kspace}.{table} (
-            latin text,
-            english text,
-            german text,
-            PRIMARY KEY (latin)
-        );"""
-    )
-
-    # add values
-    casdriv_cns.session.execute(
-        f"""INSERT INTO {kspace}.{table} (
-            latin,
-            english,
-            german
-        ) VALUES ('deus_ex', 'not_a_plant', 'wasndas')"""
-    )
-    casdriv_cns.session.execute(
-        f"""INSERT INTO {kspace}.{table} (
-            latin,
-            english,
-            german
-        ) VALUES ('machina', 'also_not_a_plant', 'wasndas2')"""
+    # create table and add values
+    seeded_table(
+        kspace,
+        table,
+        [
+            ("deus_ex", "not_a_plant", "wasndas"),
+            ("machina", "also_not_a_plant", "wasndas2"),
+        ],
     )
 
     all_entries = cql.get_all_entries(
@@ -187,86 +163,52 @@ def test_get_all_entries(casdriv_cns):
         assert dict_result in all_entries
 
 
-def test_get_all_entries_exceptions(casdriv_cns):
+def test_get_all_entries_exceptions(casdriv_cns, seeded_table):
     """Test cql.get_all_entries exception rasising."""
     kspace = "pytest_cql_simple_keyspace"
     table = "cql_get_all_entries_exception"
 
-    # create table
-    casdriv_cns.session.execute(
-        f"""CREATE TABLE IF NOT EXISTS {kspace}.{table} (
-            latin text,
-            english text,
-            german text,
-            PRIMARY KEY (latin)
-        );"""
-    )
-
-    # add values
-    casdriv_cns.session.execute(
-        f"""INSERT INTO {kspace}.{table} (
-            latin,
-            english,
-            german
-        ) VALUES ('deus_ex', 'not_a_plant', 'wasndas')"""
+    # create table and add values
+    seeded_table(
+        kspace,
+        table,
+        [
+            ("deus_ex", "not_a_plant", "wasndas"),
+        ],
     )
 
     # keyspace exception
-    kspace_error = table_error = "no error"
-    try:
+    with pytest.raises(KeyError, match="Unknown keyspace: 'not a keyspace'"):
         cql.get_all_entries(
             cluster=casdriv_cns.cluster,
             session=casdriv_cns.session,
             keyspace="not a keyspace",
             table=table,
         )
-    except KeyError as err:
-        kspace_error = str(err)
 
     # table exception
-    try:
+    with pytest.raises(KeyError, match="Unknown table: 'not in here'"):
         cql.get_all_entries(
             cluster=casdriv_cns.cluster,
             session=casdriv_cns.session,
             keyspace=kspace,
             table="not in here",
         )
-    except KeyError as err:
-        table_error = str(err)
-
-    assert "Unknown keyspace: 'not a keyspace'" in kspace_error
-    assert "Unknown table: 'not in here'" in table_error
 
 
-def test_drop_row(casdriv_cns):
+def test_drop_row(casdriv_cns, mutable_keyspace, seeded_table):
     """Test cql.drop_row."""
-    kspace = "pytest_cql_simple_keyspace"
+    kspace = mutable_keyspace
     table = "cql_drop_row"
 
-    # create table
-    casdriv_cns.session.execute(
-        f"""CREATE TABLE IF NOT EXISTS {kspace}.{table} (
-            latin text,
-            english text,
-            german text,
-            PRIMARY KEY (latin)
-        );"""
-    )
-
-    # add values
-    casdriv_cns.session.execute(
-        f"""INSERT INTO {kspace}.{table} (
-            latin,
-            english,
-            german
-        ) VALUES ('deus_ex', 'not_a_plant', 'wasndas')"""
-    )
-    casdriv_cns.session.execute(
-        f"""INSERT INTO {kspace}.{table} (
-            latin,
-            english,
-            german
-        ) VALUES ('machina', 'also_not_a_plant', 'wasndas2')"""
+    # create table and add values
+    seeded_table(
+        kspace,
+        table,
+        [
+            ("deus_ex", "not_a_plant", "wasndas"),
+            ("machina", "also_not_a_plant", "wasndas2"),
+        ],
     )
 
     cql.drop_row(
@@ -294,33 +236,22 @@ def test_drop_row(casdriv_cns):
     assert expected_result == all_entries
 
 
-def test_drop_rows_exceptions(casdriv_cns):
+def test_drop_rows_exceptions(casdriv_cns, seeded_table):
     """Test cql.list_column_values exception rasising."""
     kspace = "pytest_cql_simple_keyspace"
     table = "cql_drop_rows_exception"
 
-    # create table
-    casdriv_cns.session.execute(
-        f"""CREATE TABLE IF NOT EXISTS {kspace}.{table} (
-            latin text,
-            english text,
-            german text,
-            PRIMARY KEY (latin)
-        );"""
-    )
-
-    # add values
-    casdriv_cns.session.execute(
-        f"""INSERT INTO {kspace}.{table} (
-            latin,
-            english,
-            german
-        ) VALUES ('deus_ex', 'not_a_plant', 'wasndas')"""
+    # create table and add values
+    seeded_table(
+        kspace,
+        table,
+        [
+            ("deus_ex", "not_a_plant", "wasndas"),
+        ],
     )
 
-    kspace_error = table_error = pk_error = pkv_error = "no error yet"
     # keyspace exception
-    try:
+    with pytest.raises(KeyError, match="Unknown keyspace: 'not a keyspace'"):
         cql.drop_row(
             cns=casdriv_cns,
             keyspace="not a keyspace",
@@ -328,11 +259,9 @@ def test_drop_rows_exceptions(casdriv_cns):
             primary_key="latin",
             value="machina",
         )
-    except KeyError as err:
-        kspace_error = str(err)
 
     # table exception
-    try:
+    with pytest.raises(KeyError, match="Unknown table: 'not in here'"):
         cql.drop_row(
             cns=casdriv_cns,
             keyspace=kspace,
@@ -340,11 +269,9 @@ def test_drop_rows_exceptions(casdriv_cns):
             primary_key="latin",
             value="machina",
         )
-    except KeyError as err:
-        table_error = str(err)
 
     # primary key exception
-    try:
+    with pytest.raises(KeyError, match=r"Unknown primary key: ';\*/ my injection'"):
         cql.drop_row(
             cns=casdriv_cns,
             keyspace=kspace,
@@ -352,11 +279,11 @@ def test_drop_rows_exceptions(casdriv_cns):
             primary_key=";*/ my injection",
             value="machina",
         )
-    except KeyError as err:
-        pk_error = str(err)
 
     # primary key value exception
-    try:
+    with pytest.raises(
+        KeyError, match=r"Unknown primary key value: '\*/;status=admin'"
+    ):
         cql.drop_row(
             cns=casdriv_cns,
             keyspace=kspace,
@@ -364,44 +291,126 @@ def test_drop_rows_exceptions(casdriv_cns):
             primary_key="latin",
             value="*/;status=admin",
         )
-    except KeyError as err:
-        pkv_error = str(err)
 
-    assert "Unknown keyspace: 'not a keyspace'" in kspace_error
-    assert "Unknown table: 'not in here'" in table_error
-    assert "Unknown primary key: ';*/ my injection'" in pk_error
-    assert "Unknown primary key value: '*/;status=admin'" in pkv_error
 
+def test_drop_row_by_pks(casdriv_cns, mutable_keyspace, seeded_table):
+    """Test cql.drop_row_by_pks using a composite primary key."""
+    kspace = mutable_keyspace
+    table = "cql_drop_row_by_pks"
+
+    # create table and add values
+    seeded_table(
+        kspace,
+        table,
+        [
+            ("deus_ex", "not_a_plant", "wasndas"),
+            ("deus_ex", "also_not_a_plant", "wasndas2"),
+        ],
+        primary_key="latin, english",
+    )
 
-def test_drop_all_rows(casdriv_cns):
-    """Test cql.drop_row."""
-    kspace = "pytest_cql_simple_keyspace"
-    table = "cql_drop_all_rows"
+    cql.drop_row_by_pks(
+        cns=casdriv_cns,
+        keyspace=kspace,
+        table=table,
+        pk_values={"english": "also_not_a_plant", "latin": "deus_ex"},
+    )
 
-    # create table
-    casdriv_cns.session.execute(
-        f"""CREATE TABLE IF NOT EXISTS {kspace}.{table} (
-            latin text,
-            english text,
-            german text,
-            PRIMARY KEY (latin)
-        );"""
+    all_entries = cql.get_all_entries(
+        cluster=casdriv_cns.cluster,
+        session=casdriv_cns.session,
+        keyspace=kspace,
+        table=table,
     )
 
-    # add values
-    casdriv_cns.session.execute(
-        f"""INSERT INTO {kspace}.{table} (
-            latin,
-            english,
-            german
-        ) VALUES ('deus_ex', 'not_a_plant', 'wasndas')"""
+    expected_result = [
+        {
+            "latin": "deus_ex",
+            "english": "not_a_plant",
+            "german": "wasndas",
+        },
+    ]
+    assert expected_result == all_entries
+
+    # primary key exception
+    with pytest.raises(KeyError, match="Unknown primary key: 'german'"):
+        cql.drop_row_by_pks(
+            cns=casdriv_cns,
+            keyspace=kspace,
+            table=table,
+            pk_values={"german": "wasndas"},
+        )
+
+    # partition key exceptions, raised before querying
+    with pytest.raises(KeyError, match="Missing partition key: 'latin'"):
+        cql.drop_row_by_pks(
+            cns=casdriv_cns,
+            keyspace=kspace,
+            table=table,
+            pk_values={"english": "not_a_plant"},
+        )
+
+    with pytest.raises(KeyError, match="Missing partition key: 'latin'"):
+        cql.drop_row_by_pks(
+            cns=casdriv_cns,
+            keyspace=kspace,
+            table=table,
+            pk_values={},
+        )
+
+
+def test_drop_row_by_pks_range(casdriv_cns, mutable_keyspace, seeded_table):
+    """Test cql.drop_row_by_pks on a case sensitive table by key prefix."""
+    kspace = mutable_keyspace
+    table = "CqlDropRowByPksRange"
+
+    # quoted, like the case sensitive tables of generated models
+    seeded_table(
+        kspace,
+        f'"{table}"',
+        [
+            ("deus_ex", "not_a_plant", "wasndas"),
+            ("deus_ex", "not_a_plant", "wasndas2"),
+            ("deus_ex", "also_not_a_plant", "wasndas3"),
+        ],
+        primary_key="latin, english, german",
+    )
+
+    # clustering keys have to form a prefix, raised before querying
+    with pytest.raises(
+        KeyError, match="Clustering key 'german' given without 'english'"
+    ):
+        cql.drop_row_by_pks(
+            cns=casdriv_cns,
+            keyspace=kspace,
+            table=table,
+            pk_values={"latin": "deus_ex", "german": "wasndas"},
+        )
+
+    cql.drop_row_by_pks(
+        cns=casdriv_cns,
+        keyspace=kspace,
+        table=table,
+        pk_values={"latin": "deus_ex", "english": "not_a_plant"},
     )
-    casdriv_cns.session.execute(
-        f"""INSERT INTO {kspace}.{table} (
-            latin,
-            english,
-            german
-        ) VALUES ('machina', 'also_not_a_plant', 'wasndas2')"""
+
+    rows = casdriv_cns.session.execute(f'SELECT german FROM {kspace}."{table}"')
+    assert [row["german"] for row in rows] == ["wasndas3"]
+
+
+def test_drop_all_rows(casdriv_cns, mutable_keyspace, seeded_table):
+    """Test cql.drop_row."""
+    kspace = mutable_keyspace
+    table = "cql_drop_all_rows"
+
+    # create table and add values
+    seeded_table(
+        kspace,
+        table,
+        [
+            ("deus_ex", "not_a_plant", "wasndas"),
+            ("machina", "also_not_a_plant", "wasndas2"),
+        ],
     )
 
     cql.drop_all_rows(
@@ -422,52 +431,34 @@ def test_drop_all_rows(casdriv_cns):
     assert not all_entries
 
 
-def test_drop_all_rows_exceptions(casdriv_cns):
+def test_drop_all_rows_exceptions(casdriv_cns, seeded_table):
     """Test cql.drop_all_rows exception rasising."""
     kspace = "pytest_cql_simple_keyspace"
     table = "cql_drop_all_rows_exception"
 
-    # create table
-    casdriv_cns.session.execute(
-        f"""CREATE TABLE IF NOT EXISTS {kspace}.{table} (
-            latin text,
-            english text,
-            german text,
-            PRIMARY KEY (latin)
-        );"""
+    # create table and add values
+    seeded_table(
+        kspace,
+        table,
+        [
+            ("deus_ex", "not_a_plant", "wasndas"),
+        ],
     )
 
-    # add values
-    casdriv_cns.session.execute(
-        f"""INSERT INTO {kspace}.{table} (
-            latin,
-            english,
-            german
-        ) VALUES ('deus_ex', 'not_a_plant', 'wasndas')"""
-    )
-
-    kspace_error = table_error = "no error"
     # keyspace exception
-    try:
+    with pytest.raises(KeyError, match="Unknown keyspace: 'not a keyspace'"):
         cql.drop_all_rows(
             cluster=casdriv_cns.cluster,
             session=casdriv_cns.session,
             keyspace="not a keyspace",
             table=table,
         )
-    except KeyError as err:
-        kspace_error = str(err)
 
     # table exception
-    try:
+    with pytest.raises(KeyError, match="Unknown table: 'not in here'"):
         cql.drop_all_rows(
             cluster=casdriv_cns.cluster,
             session=casdriv_cns.session,
             keyspace=kspace,
             table="not in here",
         )
-    except KeyError as err:
-        table_error = str(err)
-
-    assert "Unknown keyspace: 'not a keyspace'" in kspace_error
-    assert "Unknown table: 'not in here'" in table_error
@@ -1,11 +1,24 @@
 # tests/db_api/test_model.py
+# pylint: disable=redefined-outer-name
 """Test creating dynamic models using cassy."""
-import os
+import json
+import pickle  # noqa: S403
+import shutil
+import sys
 import tempfile
+from copy import deepcopy
+from dataclasses import FrozenInstanceError, asdict, replace
 from pathlib import Path
 
+import pytest
+
 import cassy.casdriv as cassy_driv
-from cassy.model import MetaModel, create_data_model, retrieve_data_model
+from cassy.model import (
+    MetaModel,
+    build_data_model,
+    create_data_model,
+    retrieve_data_model,
+)
 
 ccfts_mm = MetaModel(
     name="CrawfordCommonFruitingTrees",
@@ -30,144 +43,238 @@ ccfts_mm2 = MetaModel(
     },
 )
 
+CCFTS_FULLCYCLE_ROW = {
+    "Latin": "quad erat demonstrandum",
+    "English": "full cycle plant",
+    "German": "schreiben lesen speichern laden",
+    "USDA_Hardiness": 9000,
+}
+
+
+@pytest.fixture(scope="session")
+def ccfts_model_path(tmp_path_factory):
+    """Provide the path the ``ccfts_mm`` model file is requested at."""
+    return tmp_path_factory.mktemp("models") / "pytest_tmp_model.py"
+
+
+@pytest.fixture(scope="session")
+def ccfts_generated_path(ccfts_model_path):
+    """Create the ``ccfts_mm`` model file once for all retrieving tests."""
+    # shared, so copy it into the test's own tmp_path before mutating it
+    return create_data_model(meta_model=ccfts_mm, path=ccfts_model_path)
 
-def test_default_model_creation(tmp_path):
+
+def test_default_model_creation(tmp_path, ccfts_model_path, ccfts_generated_path):
     """Test cassy dynamic model creation using default arguments."""
-    return_path = create_data_model(
-        meta_model=ccfts_mm, path=tmp_path / "pytest_tmp_model.py"
+    assert ccfts_generated_path == ccfts_model_path
+    assert ccfts_model_path.is_file()
+
+    # equal meta models render equal modules, apart from their path line
+    other_path = create_data_model(
+        meta_model=ccfts_mm, path=tmp_path / "pytest_other_model.py"
     )
-    expected_path = tmp_path / "pytest_tmp_model.py"
-    assert return_path == expected_path
-    assert expected_path.is_file()
+    assert (
+        other_path.read_text(encoding="utf8").splitlines()[1:]
+        == ccfts_generated_path.read_text(encoding="utf8").splitlines()[1:]
+    )
+
+
+@pytest.fixture()
+def pre_created_model_path(tmp_path, ccfts_generated_path):
+    """Copy the pre created ``ccfts_mm`` model file into ``tmp_path``."""
+    return Path(shutil.copy(ccfts_generated_path, tmp_path / "pytest_tmp_model.py"))
 
 
-def test_model_creation_overwrite(tmp_path):
-    """Test cassy dynamic model creation overwriting."""
-    create_data_model(meta_model=ccfts_mm, path=tmp_path / "pytest_tmp_model.py")
+def test_overwrite_refused_without_flag(pre_created_model_path):
+    """Test cassy dynamic model creation refusing to overwrite."""
+    with pytest.raises(
+        FileExistsError, match=r"Set 'overwrite=True' or change filepath"
+    ):
+        create_data_model(meta_model=ccfts_mm2, path=pre_created_model_path)
 
-    # unsuccesfull overwrite attempt:
-    file_exists_error_msg = ""
-    try:
-        create_data_model(meta_model=ccfts_mm, path=tmp_path / "pytest_tmp_model.py")
 
-    # pylint: disable=broad-except
-    except Exception as err:
-        file_exists_error_msg = str(err)
-    # pylint: enable=broad-except
+def test_identical_recreation(tmp_path, pre_created_model_path):
+    """Test recreating an identical model being a no-op."""
+    mtime_ns = pre_created_model_path.stat().st_mtime_ns
 
-    fix_msg = "Set 'overwrite=True' or change filepath"
+    return_path = create_data_model(meta_model=ccfts_mm, path=pre_created_model_path)
 
-    assert fix_msg in file_exists_error_msg
+    assert return_path == pre_created_model_path
+    assert return_path.stat().st_mtime_ns == mtime_ns
+    assert next(tmp_path.glob("pytest_tmp_model_backup_*"), None) is None
 
-    # succesfull overwrite w/o backup
+
+def test_edited_recreation(pre_created_model_path):
+    """Test recreating over a hand edited model file being refused."""
+    edited = pre_created_model_path.read_text(encoding="utf8") + "# edited\n"
+    pre_created_model_path.write_text(edited, encoding="utf8")
+
+    with pytest.raises(FileExistsError):
+        create_data_model(meta_model=ccfts_mm, path=pre_created_model_path)
+
+
+def test_overwrite_no_backup(tmp_path, pre_created_model_path):
+    """Test cassy dynamic model creation overwriting without backup."""
     return_path = create_data_model(
         meta_model=ccfts_mm2,
-        path=tmp_path / "pytest_tmp_model.py",
+        path=pre_created_model_path,
         overwrite=True,
         backup=False,
     )
 
     assert return_path.is_file()
+    assert "shade_tolerance" in return_path.read_text(encoding="utf8")
+    assert next(tmp_path.glob("pytest_tmp_model_backup_*"), None) is None
+
 
-    # succesfull overwrite w/ backup
+def test_overwrite_with_backup(tmp_path, pre_created_model_path):
+    """Test cassy dynamic model creation overwriting with backup."""
     return_path = create_data_model(
         meta_model=ccfts_mm2,
-        path=tmp_path / "pytest_tmp_model.py",
+        path=pre_created_model_path,
         overwrite=True,
         backup=True,
     )
 
     assert return_path.is_file()
-
-    dir_list = os.listdir(tmp_path)
-    assert any("pytest_tmp_model_backup_" in entry for entry in dir_list)
+    assert next(tmp_path.glob("pytest_tmp_model_backup_*"), None) is not None
 
 
 def test_create_model_design_case():
     """Test creating a meta model in a home folder located tempdir."""
     home = Path("~").expanduser()
-    tempfile.tempdir = home
-    with tempfile.TemporaryDirectory() as tempdirname:
-        return_path = create_data_model(
-            meta_model=ccfts_mm,
-            path=os.path.join("~", tempdirname, "pytest_home_model.py"),
-        )
+    with tempfile.TemporaryDirectory(dir=home) as tempdirname:
+        model_path = Path("~") / tempdirname / "pytest_home_model.py"
+        return_path = create_data_model(meta_model=ccfts_mm, path=model_path)
 
         assert return_path.is_file()
-        expected_path = home / tempdirname / "pytest_home_model.py"
 
-    assert expected_path == return_path
+    assert return_path == model_path.expanduser()
 
 
-def test_retrieve_model(tmp_path):
+def test_retrieve_model(ccfts_generated_path):
     """Test retrieving a prior created model."""
-    return_path = create_data_model(
-        meta_model=ccfts_mm, path=tmp_path / "pytest_retrieve_model.py"
+    model = retrieve_data_model(
+        path=ccfts_generated_path,
+        model_name=ccfts_mm.name,
     )
-    expected_path = tmp_path / "pytest_retrieve_model.py"
-    assert return_path == expected_path
-    assert expected_path.is_file()
 
-    model = retrieve_data_model(
-        path=expected_path,
+    # pylint: disable=protected-access
+    assert model.__table_name__ == ccfts_mm.name
+    assert tuple(model._primary_keys) == ccfts_mm.all_primary_keys
+    assert tuple(model._clustering_keys) == ccfts_mm.clustering_key_names
+    assert tuple(model._columns) == ccfts_mm.all_columns
+    # pylint: enable=protected-access
+
+    # unchanged model files are retrieved from cache
+    assert model is retrieve_data_model(
+        path=ccfts_generated_path,
         model_name=ccfts_mm.name,
     )
 
-    expected_primary_keys = [
-        *ccfts_mm.primary_keys.keys(),
-        *ccfts_mm.clustering_keys.keys(),
-    ]
 
-    expected_clustering_keys = list(ccfts_mm.clustering_keys.keys())
+def test_retrieve_model_shadowing(tmp_path):
+    """Test retrieving models named like a real module or each other."""
+    model_path = create_data_model(meta_model=ccfts_mm, path=tmp_path / "json.py")
+    (tmp_path / "other").mkdir()
+    other_path = create_data_model(
+        meta_model=ccfts_mm2, path=tmp_path / "other" / "json.py"
+    )
+
+    model = retrieve_data_model(path=model_path, model_name=ccfts_mm.name)
+    other = retrieve_data_model(path=other_path, model_name=ccfts_mm2.name)
+
+    assert model.__module__.startswith("cassy._models.json_")
+    assert model.__module__ != other.__module__
+    assert Path(sys.modules[model.__module__].__file__) == model_path.resolve()
+    assert sys.modules["json"] is json
+
+
+def test_retrieve_model_failing(tmp_path):
+    """Test retrieving a broken model file not leaving its module behind."""
+    broken_path = tmp_path / "pytest_broken_model.py"
+    broken_path.write_text("raise RuntimeError('broken model')\n", encoding="utf8")
+    modules = set(sys.modules)
+
+    with pytest.raises(RuntimeError, match="broken model"):
+        retrieve_data_model(path=broken_path, model_name=ccfts_mm.name)
+
+    assert set(sys.modules) == modules
+
+
+def test_meta_model_frozen():
+    """Test meta models being immutable and hashable."""
+    equal_mm = MetaModel(
+        name=ccfts_mm.name,
+        primary_keys=dict(ccfts_mm.primary_keys),
+        clustering_keys=dict(ccfts_mm.clustering_keys),
+        columns=dict(ccfts_mm.columns),
+    )
+    assert equal_mm == ccfts_mm
+    assert hash(equal_mm) == hash(ccfts_mm)
+    assert ccfts_mm2 != ccfts_mm
+    assert ccfts_mm != object()
+
+    # clustering key types and orders may be given as lists, too
+    listed_mm = replace(
+        ccfts_mm,
+        clustering_keys={
+            name: list(type_and_order)
+            for name, type_and_order in ccfts_mm.clustering_keys.items()
+        },
+    )
+    assert listed_mm == ccfts_mm
+    assert hash(listed_mm) == hash(ccfts_mm)
+
+    # fields stay plain, copyable and picklable
+    assert asdict(ccfts_mm)["columns"] == {"USDA_Hardiness": "Integer"}
+    assert deepcopy(ccfts_mm) == ccfts_mm
+    assert pickle.loads(pickle.dumps(ccfts_mm)) == ccfts_mm  # noqa: S301
+
+    assert ccfts_mm.all_primary_keys == ("Latin", "English", "German")
+    assert ccfts_mm.clustering_key_names == ("English", "German")
+    assert ccfts_mm.all_columns == ("Latin", "English", "German", "USDA_Hardiness")
 
-    expected_columns = [
-        *expected_primary_keys,
-        *ccfts_mm.columns.keys(),
-    ]
+    with pytest.raises(FrozenInstanceError):
+        ccfts_mm.name = "Changed"
+
+
+def test_build_model():
+    """Test building a model in memory."""
+    model = build_data_model(meta_model=ccfts_mm)
 
     # pylint: disable=protected-access
     assert model.__table_name__ == ccfts_mm.name
-    assert list(model._primary_keys.keys()) == expected_primary_keys
-    assert list(model._clustering_keys.keys()) == expected_clustering_keys
-    assert list(model._columns.keys()) == expected_columns
+    assert tuple(model._primary_keys) == ccfts_mm.all_primary_keys
+    assert tuple(model._columns) == ccfts_mm.all_columns
     # pylint: enable=protected-access
 
+    # equal meta models are built from cache
+    assert model is build_data_model(meta_model=ccfts_mm)
 
-def test_create_retrieve_store_load(tmp_path, casdriv_cns):
-    """Test full create -> retrieve -> store -> load cycle."""
-    # 1. "Dynamically" create hardcoded data model
-    create_data_model(
-        meta_model=ccfts_mm,
-        path=tmp_path / "pytest_fullcycle_model.py",
-    )
-    expected_path = tmp_path / "pytest_fullcycle_model.py"
 
-    # 2. Retrieve hardcoded data model
-    retrieved_model = retrieve_data_model(
-        path=expected_path,
+@pytest.fixture(scope="module")
+def ccfts_retrieved_model(ccfts_generated_path):
+    """Retrieve the model hardcoded by :func:`ccfts_generated_path`."""
+    return retrieve_data_model(
+        path=ccfts_generated_path,
         model_name=ccfts_mm.name,
     )
 
-    # 3. Setup connection and keyspace
-    connection = cassy_driv.get_cluster_name(casdriv_cns.cluster)
-    kspace = "pytest_casdriv_fullcycle_keyspace"
-    cassy_driv.create_simple_keyspace(
-        name=kspace,
-        replication_factor=1,
-        connections=[connection],
-    )
 
-    # 4. Create an entry into the database using the retrieved model
-    data_dict = {
-        "Latin": "quad erat demonstrandum",
-        "English": "full cycle plant",
-        "German": "schreiben lesen speichern laden",
-        "USDA_Hardiness": 9000,
-    }
+def test_create_retrieve_store_load(ccfts_retrieved_model, fullcycle_keyspace):
+    """Test full create -> retrieve -> store -> load cycle."""
+    # 1. "Dynamically" create hardcoded data model, done by the fixtures
+    # 2. Retrieve hardcoded data model, done by the fixtures
+    retrieved_model = ccfts_retrieved_model
+
+    # 3. Setup connection and keyspace, done by the fixture
+    connection, kspace = fullcycle_keyspace
 
+    # 4. Create an entry into the database using the retrieved model
     cassy_driv.create_entry(
         model=retrieved_model,
-        data=data_dict,
+        data=CCFTS_FULLCYCLE_ROW,
         prior_syncing=True,
         keyspace=kspace,
         con=connection,
@@ -177,12 +284,12 @@ def test_create_retrieve_store_load(tmp_path, casdriv_cns):
     entry = cassy_driv.read_entry(
         model=retrieved_model,
         primary_keys="Latin",
-        values="quad erat demonstrandum",
+        values=CCFTS_FULLCYCLE_ROW["Latin"],
         keyspace=kspace,
         con=connection,
     )
 
-    assert "schreiben lesen speichern laden" in entry.German
+    assert entry.German == CCFTS_FULLCYCLE_ROW["German"]
 
 
 # [ ] - test_create_retrieve_store_load aka design case